@@ -10,22 +10,67 @@ import json
 import time
 import uuid
 import asyncio
+import ssl
+import sqlite3
+import zlib
+import hashlib
+import random
+import threading
+import certifi
 import httpx
-from pathlib import Path
+import orjson
 from enum import Enum, auto
 from typing import Dict, List, Union, Optional, Any, Callable, Awaitable, TextIO, TypeVar, Generic
 import logging
 import sys
 import inspect
 from inspect import iscoroutinefunction
-from functools import wraps
-from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import tempfile
 import base64
+import ipaddress
+from urllib.request import getproxies
+
+try:
+    # Installed by httpx[http2]; lets concurrent requests share one connection
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Default cache file location
 DEFAULT_CACHE_FILE = os.path.expanduser('~/.pab_sdk_cache')
 
+# Headers for request bodies serialized with orjson
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Connection pool limits for the HTTP client created by PABClient
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+# Most requests a PABClient-created HTTP client sends at once; PAB_MAX_CONCURRENCY overrides it
+DEFAULT_MAX_CONCURRENT_REQUESTS = 16
+
+# Transient failures retried by PABClient-created HTTP clients, as in the sync client
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Statuses whose Retry-After header is honoured, as urllib3 does
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+# Seconds between keep-alive requests during interactive chats; well under keepalive_expiry
+KEEP_ALIVE_INTERVAL = 25.0
+
+# Readiness polls start quickly, then back off to this many seconds between checks
+READY_POLL_INITIAL_DELAY = 0.25
+READY_POLL_MAX_DELAY = 3.0
+
+# Opt-in store of agent responses, enabled by setting PAB_RESPONSE_CACHE=1
+RESPONSE_CACHE_FILE = os.path.expanduser('~/.pab_sdk_responses.db')
+RESPONSE_CACHE_TTL = 7 * 24 * 3600
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +83,266 @@ logger = logging.getLogger('pab_sdk')
 httpx_logger = logging.getLogger('httpx')
 httpx_logger.setLevel(logging.WARNING)
 
+def _load_credentials(path: str) -> Dict[str, Any]:
+    """Read and parse a credentials JSON file, reusing the parsed result until the file changes
+    
+    Args:
+        path: Path to the credentials JSON file
+        
+    Returns:
+        The parsed credentials. Callers must not modify it.
+    """
+    path = os.path.abspath(path)
+    return _parse_credentials(path, os.stat(path).st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _parse_credentials(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a credentials file; the modification time is part of the cache key"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+class _ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that lets at most as many requests be in flight as the semaphore allows
+    
+    With HTTP/2 many requests share one connection, so the pool limits alone
+    don't stop a large fan-out from hitting the server's rate limits. Direct
+    and proxied transports share one semaphore.
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport, semaphore: asyncio.Semaphore):
+        self._transport = transport
+        self._semaphore = semaphore
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+    
+    async def aclose(self):
+        await self._transport.aclose()
+
+async def _send_with_retries(send: Callable[[httpx.Request], Awaitable[httpx.Response]],
+                             request: httpx.Request, retries: int = MAX_RETRIES,
+                             backoff_factor: float = RETRY_BACKOFF_FACTOR) -> httpx.Response:
+    """Send a request, retrying transient failures with jittered exponential backoff
+    
+    Idempotent requests are retried on connection errors and on 429/502/503/504.
+    Other requests (e.g. sendMessage) are only retried when the connection
+    could not be opened, since the server never saw them. A Retry-After header
+    on 429/503 takes precedence over the backoff.
+    
+    Args:
+        send: Sends the request once, e.g. a transport's handle_async_request
+        request: The request to send
+        retries: Most retries after the first attempt
+        backoff_factor: Upper bound of the first backoff in seconds; doubles per retry
+        
+    Returns:
+        The first response that isn't retried
+    """
+    idempotent = request.method in IDEMPOTENT_METHODS
+    for attempt in range(retries + 1):
+        last_attempt = attempt == retries
+        try:
+            response = await send(request)
+        except httpx.ConnectError:
+            if last_attempt:
+                raise
+        except httpx.TransportError:
+            if last_attempt or not idempotent:
+                raise
+        else:
+            if last_attempt or not idempotent or response.status_code not in RETRY_STATUS_CODES:
+                return response
+            await response.aclose()
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                await asyncio.sleep(retry_after)
+                continue
+        # Full jitter keeps concurrent retries from arriving together
+        await asyncio.sleep(random.uniform(0, backoff_factor * 2 ** attempt))
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait according to the response's Retry-After header, if it has a usable one"""
+    if response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """Transport that retries transient failures, as _send_with_retries describes"""
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport, retries: int = MAX_RETRIES,
+                 backoff_factor: float = RETRY_BACKOFF_FACTOR):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await _send_with_retries(
+            self._transport.handle_async_request, request, self._retries, self._backoff_factor
+        )
+    
+    async def aclose(self):
+        await self._transport.aclose()
+
+class _ResponseCache:
+    """Agent responses stored in SQLite, compressed, and kept for a fixed time
+    
+    The methods block on disk I/O; AgentInterface calls get and set in an executor.
+    """
+    
+    def __init__(self, path: str, ttl: float):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, content BLOB)"
+        )
+        self._db.commit()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content FROM responses WHERE key = ? AND created > ?",
+                (key, time.time() - self._ttl)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+    
+    def set(self, key: str, content: str):
+        compressed = zlib.compress(content.encode('utf-8'))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, time.time(), compressed)
+            )
+            self._db.commit()
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+def _response_cache() -> Optional[_ResponseCache]:
+    """Open the response cache if PAB_RESPONSE_CACHE is set, otherwise return None"""
+    if os.environ.get("PAB_RESPONSE_CACHE", "").lower() not in ("1", "true", "yes"):
+        return None
+    return _ResponseCache(RESPONSE_CACHE_FILE, RESPONSE_CACHE_TTL)
+
+async def _wait_or_cancel(tasks: List[asyncio.Future]) -> None:
+    """Wait for all tasks; on the first failure cancel the others and raise it
+    
+    Unlike asyncio.gather, the remaining tasks don't keep running after the
+    caller has already seen the error (or has itself been cancelled).
+    """
+    if not tasks:
+        return
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+    errors = [task.exception() for task in tasks if not task.cancelled()]
+    for error in errors:
+        if error is not None:
+            raise error
+
+class _AgentState:
+    """What a PABClient knows about one agent's tools and documents
+
+    Kept per agent ID, so interfaces for an earlier agent keep working after
+    the client creates or loads another one.
+    """
+
+    def __init__(self, fingerprint: List[Any]):
+        # Tool IDs by name
+        self.tools: Dict[str, str] = {}
+        # Tool details from the last list_tools() call, kept up to date by add_tool
+        self.tool_list: Optional[List[Dict[str, Any]]] = None
+        # Bumped whenever the agent's tools change, so a list_tools() fetch that
+        # overlapped a change doesn't cache a stale list
+        self.tool_list_generation = 0
+        # Agent configuration plus the tool and document changes made through
+        # this client; part of the response cache key
+        self.fingerprint = fingerprint
+        # Held while the document tool is looked up or created, so concurrent
+        # add_document calls from any interface create it only once
+        self.document_tool_lock = asyncio.Lock()
+
+    def invalidate_tool_list(self):
+        """Drop the cached tool list, including any list_tools() result still in flight"""
+        self.tool_list = None
+        self.tool_list_generation += 1
+
+def _environment_proxy_mounts() -> Dict[str, Optional[str]]:
+    """Map httpx mount patterns to the proxy URLs set in the environment
+    
+    Follows the same rules as httpx's own trust_env handling: HTTP(S)_PROXY and
+    ALL_PROXY give the proxies, and each NO_PROXY entry maps to None so those
+    hosts are reached directly. NO_PROXY=* turns proxying off altogether.
+    
+    Returns:
+        Mount patterns such as "https://" or "all://*example.com", each with
+        its proxy URL, or None for a direct connection
+    """
+    proxies = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        proxy = proxies.get(scheme)
+        if proxy:
+            mounts[f"{scheme}://"] = proxy if "://" in proxy else f"http://{proxy}"
+    
+    for host in (host.strip() for host in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host.split("/")[0])
+        except ValueError:
+            address = None
+        if address is None and host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        elif address is None:
+            # ".example.com" covers its subdomains; "example.com" covers the domain too
+            mounts[f"all://*{host}"] = None
+        elif address.version == 6:
+            mounts[f"all://[{host}]"] = None
+        else:
+            mounts[f"all://{host}"] = None
+    return mounts
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context shared by every HTTP client PABClient creates
+    
+    Loading the CA bundle is the slow part of creating an httpx client, so it
+    is done once. SSL_CERT_FILE / SSL_CERT_DIR are honoured like httpx does.
+    
+    Returns:
+        The shared SSL context
+    """
+    cafile = os.environ.get("SSL_CERT_FILE")
+    capath = os.environ.get("SSL_CERT_DIR")
+    if not cafile and not capath:
+        cafile = certifi.where()
+    return ssl.create_default_context(cafile=cafile, capath=capath)
+
 # Define enums
 class MessageRole(Enum):
     USER = "user"
@@ -94,6 +399,12 @@ class PABClient:
     """
     
     _cached_credentials_path = None
+    # Access tokens shared by all instances, keyed by (client_id, token_url)
+    _token_cache: Dict[tuple, tuple] = {}
+    # Token fetches in flight, keyed by (event loop id, client_id, token_url); a
+    # task can only be awaited on its own loop, and each entry is removed as
+    # soon as its fetch finishes
+    _token_fetches: Dict[tuple, "asyncio.Task[tuple]"] = {}
     
     @classmethod
     def _get_cached_credentials_path(cls) -> Optional[str]:
@@ -102,54 +413,88 @@ class PABClient:
             return PABClient._cached_credentials_path
         
         # Check for cache file
-        if os.path.exists(DEFAULT_CACHE_FILE):
-            try:
-                with open(DEFAULT_CACHE_FILE, 'r') as f:
-                    data = json.load(f)
-                    return data.get('credentials_path')
-            except (json.JSONDecodeError, IOError):
-                return None
-        return None
+        return cls._read_cache_file().get('credentials_path')
     
     @classmethod
-    def _cache_credentials_path(cls, path: str) -> None:
-        """Cache the credentials path for future use"""
-        PABClient._cached_credentials_path = path
+    def _read_cache_file(cls) -> Dict[str, Any]:
+        """Read the cache file
+        
+        Returns:
+            The cached entries, or an empty dict if there is no usable cache file
+        """
+        try:
+            with open(DEFAULT_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    @classmethod
+    def _update_cache_file(cls, **entries) -> None:
+        """Merge entries into the cache file, keeping the ones already there
+        
+        The file can hold an access token, so it is only readable by its owner.
+        It is written to a private temporary file and moved into place, which
+        also replaces files left world-readable by older versions and means
+        readers never see a partly written file.
+        """
+        data = cls._read_cache_file()
+        data.update(entries)
+        tmp_path = None
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(DEFAULT_CACHE_FILE), exist_ok=True)
+            cache_dir = os.path.dirname(DEFAULT_CACHE_FILE)
+            os.makedirs(cache_dir, exist_ok=True)
             
-            # Write to cache file
-            with open(DEFAULT_CACHE_FILE, 'w') as f:
-                json.dump({'credentials_path': path}, f)
+            # mkstemp creates the file with mode 0600
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.pab_sdk_cache.')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, DEFAULT_CACHE_FILE)
         except (IOError, OSError) as e:
-            logger.warning(f"Failed to write credentials path to cache: {e}")
+            logger.warning(f"Failed to write cache file: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    @classmethod
+    def _cache_credentials_path(cls, path: str) -> None:
+        """Cache the credentials path for future use"""
+        PABClient._cached_credentials_path = path
+        cls._update_cache_file(credentials_path=path)
     
     @classmethod
     def clear_cache(cls) -> bool:
         """
-        Clear the cached credentials path
+        Clear the cached credentials path and access token
         
         Returns:
             bool: True if cache was cleared, False otherwise
         """
         PABClient._cached_credentials_path = None
-        if os.path.exists(DEFAULT_CACHE_FILE):
-            try:
-                os.remove(DEFAULT_CACHE_FILE)
-                return True
-            except OSError as e:
-                logger.error(f"Failed to remove cache file: {e}")
-                return False
+        PABClient._token_cache.clear()
+        try:
+            os.remove(DEFAULT_CACHE_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove cache file: {e}")
+            return False
         return True
     
-    def __init__(self, credentials_path: str = None, name: str = "PAB Client Wrapper"):
+    def __init__(self, credentials_path: str = None, name: str = "PAB Client Wrapper",
+                 http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize a new PAB Client
         
         Args:
             credentials_path (str, optional): Path to credentials JSON file
             name (str, optional): Name to identify this client instance
+            http_client (httpx.AsyncClient, optional): HTTP client to share between
+                PABClient instances. If omitted, the client creates its own on first
+                use. A shared client is never closed by this PABClient.
         
         The client will attempt to load credentials in the following order:
         1. From the provided credentials_path parameter
@@ -167,9 +512,13 @@ class PABClient:
         self._api_url = None
         self._token = None
         self._token_expiry = None
-        self._client = None
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._max_concurrency = self._max_concurrency_from_env()
         self._agent_id = None
         self._cached_tools = {}
+        # Opened once here and closed by aclose(); None unless PAB_RESPONSE_CACHE is set
+        self._response_cache = _response_cache()
         
         # Try to get credentials path from parameter or cache
         if credentials_path:
@@ -202,22 +551,25 @@ class PABClient:
         self._chat_id = None
         self._clients = {}
         self._agent_configs = {}
-        self._tools = {}
-        
+        # Tools, documents and response cache fingerprint of each agent used so far
+        self._agents: Dict[str, _AgentState] = {}
+
     def _load_credentials_from_file(self, credentials_path: str):
         """Load credentials from a JSON file
         
         Args:
             credentials_path: Path to the credentials JSON file
         """
-        binding_file = Path(credentials_path)
-        if not binding_file.exists():
+        try:
+            binding = _load_credentials(credentials_path)
+        except FileNotFoundError:
             raise ValueError(f"Credentials file not found: {credentials_path}")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in credentials file: {credentials_path}")
+        except OSError as e:
+            raise ValueError(f"Error loading credentials from {credentials_path}: {str(e)}")
         
         try:
-            with open(binding_file, 'r') as f:
-                binding = json.load(f)
-            
             # Extract credentials from binding
             if 'uaa' in binding and 'service_urls' in binding:
                 self._client_id = binding['uaa']['clientid']
@@ -227,8 +579,6 @@ class PABClient:
                 logger.info(f"Successfully loaded credentials from {credentials_path}")
             else:
                 raise ValueError(f"Invalid credentials file format. Missing 'uaa' or 'service_urls' fields.")
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON in credentials file: {credentials_path}")
         except Exception as e:
             raise ValueError(f"Error loading credentials from {credentials_path}: {str(e)}")
             
@@ -302,12 +652,57 @@ class PABClient:
     async def _get_token(self) -> str:
         """Get an authentication token, refreshing if necessary
         
+        Concurrent callers with the same credentials on one event loop share a
+        single fetch instead of each requesting a token.
+        
         Returns:
             The valid access token
         """
-        if not self._token or time.time() > self._token_expiry * 0.9:
-            await self._refresh_token()
+        if self._token and time.time() < self._token_expiry - 60:
+            return self._token
+        
+        loop = asyncio.get_running_loop()
+        fetch_key = (id(loop), self._client_id, self._token_url)
+        fetch = PABClient._token_fetches.get(fetch_key)
+        if fetch is None:
+            fetch = PABClient._token_fetches[fetch_key] = loop.create_task(self._fetch_token())
+            fetch.add_done_callback(lambda _: PABClient._token_fetches.pop(fetch_key, None))
+        # A cancelled caller mustn't cancel the fetch the others are waiting for
+        self._token, self._token_expiry = await asyncio.shield(fetch)
         return self._token
+    
+    async def _fetch_token(self) -> tuple:
+        """Get a token from the in-process cache, the cache file or the token endpoint
+        
+        Returns:
+            The (token, expiry time) pair
+        """
+        key = (self._client_id, self._token_url)
+        cached = PABClient._token_cache.get(key)
+        if cached and time.time() < cached[1] - 60:
+            return cached
+        if not self._load_cached_token():
+            await self._refresh_token()
+        PABClient._token_cache[key] = (self._token, self._token_expiry)
+        return self._token, self._token_expiry
+    
+    def _load_cached_token(self) -> bool:
+        """Load a still-valid access token from the cache file
+        
+        Returns:
+            bool: True if a token for these credentials was loaded, False otherwise
+        """
+        cached = self._read_cache_file().get('token')
+        if not isinstance(cached, dict):
+            return False
+        if cached.get('client_id') != self._client_id or cached.get('token_url') != self._token_url:
+            return False
+        expires_at = cached.get('expires_at', 0)
+        if time.time() >= expires_at - 60:
+            return False
+        self._token = cached['access_token']
+        self._token_expiry = expires_at
+        return True
         
     async def _refresh_token(self):
         """Refresh the authentication token"""
@@ -326,7 +721,7 @@ class PABClient:
             "grant_type": "client_credentials",
         }
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(verify=_ssl_context()) as client:
             response = await client.post(
                 self._token_url,
                 data=form_data,
@@ -339,20 +734,116 @@ class PABClient:
             data = response.json()
             self._token = data["access_token"]
             self._token_expiry = time.time() + data["expires_in"]
+        
+        self._update_cache_file(token={
+            "client_id": self._client_id,
+            "token_url": self._token_url,
+            "access_token": self._token,
+            "expires_at": self._token_expiry,
+        })
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get an HTTP client with the authentication token
+        """Get the HTTP client, creating it on first use
+        
+        The same client is reused for every call so its connection pool
+        (and the TCP/TLS connections in it) survive across requests.
         
         Returns:
-            An authenticated HTTP client
+            The HTTP client
+        """
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            
+            def transport(proxy: str = None) -> httpx.AsyncBaseTransport:
+                return _RetryTransport(_ConcurrencyLimitedTransport(
+                    httpx.AsyncHTTPTransport(
+                        limits=DEFAULT_HTTP_LIMITS,
+                        http2=HTTP2_AVAILABLE,
+                        verify=_ssl_context(),
+                        proxy=proxy
+                    ),
+                    semaphore
+                ))
+            
+            # httpx skips HTTP(S)_PROXY/NO_PROXY when given a custom transport,
+            # so mount the environment's proxies explicitly
+            self._client = httpx.AsyncClient(
+                timeout=300,  # 5 minutes
+                transport=transport(),
+                mounts={
+                    pattern: None if proxy is None else transport(proxy)
+                    for pattern, proxy in _environment_proxy_mounts().items()
+                }
+            )
+            self._owns_client = True
+        return self._client
+    
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request to the API with the current access token
+        
+        The API URL and Authorization header are set on this request only, so
+        an http_client shared with PABClients for other credentials or API
+        URLs is left as the caller configured it. Transient failures are
+        retried: by the transport of a client this PABClient created, and
+        here for an http_client passed in, whose transport is the caller's.
+        
+        Args:
+            method: The HTTP method
+            path: The API path, e.g. "/api/v1/Agents"
+            **kwargs: Further httpx request arguments (json, content, headers, timeout, ...)
+            
+        Returns:
+            The response
         """
         token = await self._get_token()
-        client = httpx.AsyncClient(
-            base_url=self._api_url,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=300  # 5 minutes
-        )
-        return client
+        client = await self._get_client()
+        headers = {**kwargs.pop("headers", {}), "Authorization": f"Bearer {token}"}
+        url = f"{self._api_url.rstrip('/')}{path}"
+        if self._owns_client:
+            return await client.request(method, url, headers=headers, **kwargs)
+        return await _send_with_retries(client.send, client.build_request(method, url, headers=headers, **kwargs))
+    
+    @staticmethod
+    def _max_concurrency_from_env() -> int:
+        """Read the in-flight request limit from PAB_MAX_CONCURRENCY
+        
+        Returns:
+            The limit, or DEFAULT_MAX_CONCURRENT_REQUESTS when the variable is unset
+        """
+        value = os.environ.get("PAB_MAX_CONCURRENCY")
+        if value is None:
+            return DEFAULT_MAX_CONCURRENT_REQUESTS
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            raise ValueError(f"PAB_MAX_CONCURRENCY must be a positive integer, got {value!r}")
+        return limit
+    
+    async def aclose(self):
+        """Close the response cache, and the HTTP client if it was created by this PABClient"""
+        if self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+    
+    async def warmup(self):
+        """Fetch a token and open a pooled connection to the API ahead of the first real request
+        
+        The status of the warm-up request doesn't matter; only the connection is kept.
+        """
+        try:
+            await self._request("HEAD", "")
+        except httpx.HTTPError as e:
+            logger.debug(f"Warm-up request failed: {e}")
+    
+    async def __aenter__(self) -> "PABClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
     async def _find_existing_agent_by_name(self, name: str) -> Optional[str]:
         """Find an existing agent by name
@@ -363,9 +854,8 @@ class PABClient:
         Returns:
             The agent ID if found, None otherwise
         """
-        client = await self._get_client()
         try:
-            response = await client.get("/api/v1/Agents")
+            response = await self._request("GET", "/api/v1/Agents")
             response.raise_for_status()
             agents = response.json().get("value", [])
             
@@ -385,7 +875,6 @@ class PABClient:
             agent_id: The agent ID
             config: The agent configuration
         """
-        client = await self._get_client()
         try:
             # Only update the fields that are allowed to be updated
             update_data = {
@@ -397,7 +886,7 @@ class PABClient:
             }
             
             if update_data:
-                response = await client.patch(f"/api/v1/Agents({agent_id})", json=update_data)
+                response = await self._request("PATCH", f"/api/v1/Agents({agent_id})", json=update_data)
                 response.raise_for_status()
                 logger.info(f"Updated existing agent with ID: {agent_id}")
             else:
@@ -419,10 +908,13 @@ class PABClient:
         """
         if not self._agent_id:
             raise ValueError("Agent not initialized")
-            
-        client = await self._get_client()
-        response = await client.post(
-            f"/api/v1/Agents({self._agent_id})/tools",
+        return await self._add_tool(self._agent_id, name, tool_type, **kwargs)
+    
+    async def _add_tool(self, agent_id: str, name: str, tool_type: Union[ToolType, str], **kwargs) -> str:
+        """Add a tool to the given agent; see add_tool"""
+        response = await self._request(
+            "POST",
+            f"/api/v1/Agents({agent_id})/tools",
             json={
                 "name": name,
                 "type": tool_type.value if isinstance(tool_type, ToolType) else tool_type,
@@ -431,13 +923,37 @@ class PABClient:
         )
         response.raise_for_status()
         tool_id = response.json()["ID"]
-        self._tools[name] = tool_id
+        agent = self._agent_state(agent_id)
+        agent.tools[name] = tool_id
+        agent.fingerprint.append(["tool", name, tool_type, kwargs])
         
         # Wait for the tool to be ready
-        await self._wait_for_tool_ready(tool_id)
+        tool_data = await self._wait_for_tool_ready(agent_id, tool_id)
+        agent.tool_list_generation += 1
+        if agent.tool_list is not None:
+            agent.tool_list.append(tool_data)
         
         return tool_id
     
+    def _agent_state(self, agent_id: str) -> _AgentState:
+        """Get the recorded tools and documents of an agent, starting empty for an unknown one"""
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            agent = self._agents[agent_id] = _AgentState([{"ID": agent_id}])
+        return agent
+    
+    async def add_tools(self, tools: List[Dict[str, Any]]) -> List[str]:
+        """Add several tools to the agent concurrently
+        
+        Args:
+            tools: Tool specifications, each holding the add_tool arguments,
+                e.g. {"name": "calculator", "tool_type": ToolType.CALCULATOR}
+            
+        Returns:
+            The tool IDs, in the same order as tools
+        """
+        return list(await asyncio.gather(*(self.add_tool(**spec) for spec in tools)))
+    
     async def add_document(self, doc_name: str, content: Union[str, bytes], 
                           content_type: str = "text/plain") -> str:
         """Add a document resource to a document tool
@@ -450,16 +966,30 @@ class PABClient:
         Returns:
             The resource ID
         """
-        if "document" not in self._tools:
-            raise ValueError(f"Document tool not found")
+        if not self._agent_id:
+            raise ValueError("Agent not initialized")
+        return await self._add_document(self._agent_id, doc_name, content, content_type)
+    
+    async def _add_document(self, agent_id: str, doc_name: str, content: Union[str, bytes],
+                            content_type: str = "text/plain") -> str:
+        """Add a document resource to the given agent's document tool; see add_document"""
+        agent = self._agent_state(agent_id)
+        # Wait for a document tool an interface may be creating right now
+        async with agent.document_tool_lock:
+            if "document" not in agent.tools:
+                raise ValueError(f"Document tool not found")
             
-        tool_id = self._tools["document"]
-        client = await self._get_client()
+        tool_id = agent.tools["document"]
         
         # Convert content to base64
         if isinstance(content, str):
             content = content.encode('utf-8')
-        encoded_content = base64.b64encode(content).decode('utf-8')
+        # Serialized once so retries resend the same bytes
+        body = orjson.dumps({
+            "name": doc_name,
+            "contentType": content_type,
+            "data": base64.b64encode(content).decode('utf-8')
+        })
         
         # Add document with retries
         max_retries = 3
@@ -468,13 +998,11 @@ class PABClient:
         while retry_count < max_retries:
             try:
                 logger.info(f"Sending document to API (attempt {retry_count + 1})...")
-                response = await client.post(
-                    f"/api/v1/Agents({self._agent_id})/tools({tool_id})/resources",
-                    json={
-                        "name": doc_name,
-                        "contentType": content_type,
-                        "data": encoded_content
-                    },
+                response = await self._request(
+                    "POST",
+                    f"/api/v1/Agents({agent_id})/tools({tool_id})/resources",
+                    content=body,
+                    headers=JSON_HEADERS,
                     timeout=120.0  # Longer timeout for large documents
                 )
                 response.raise_for_status()
@@ -482,8 +1010,11 @@ class PABClient:
                 
                 # Wait for the resource to be ready
                 logger.info(f"Document submitted, waiting for processing...")
-                await self._wait_for_resource_ready(tool_id, resource_id)
+                await self._wait_for_resource_ready(agent_id, tool_id, resource_id)
                 
+                agent.fingerprint.append(
+                    ["document", doc_name, hashlib.sha256(content).hexdigest()]
+                )
                 return resource_id
             except httpx.HTTPStatusError as e:
                 retry_count += 1
@@ -502,50 +1033,63 @@ class PABClient:
                 
         raise RuntimeError("Failed to add document after maximum retries")
     
-    async def _wait_for_resource_ready(self, tool_id: str, resource_id: str):
+    async def _wait_for_resource_ready(self, agent_id: str, tool_id: str, resource_id: str):
         """Wait for a resource to be ready
         
         Args:
+            agent_id: The agent ID
             tool_id: The tool ID
             resource_id: The resource ID
         """
-        client = await self._get_client()
-        ready = False
-        while not ready:
-            resource_response = await client.get(
-                f"/api/v1/Agents({self._agent_id})/tools({tool_id})/resources({resource_id})"
-            )
-            resource_response.raise_for_status()
-            resource_data = resource_response.json()
-            
-            if resource_data.get("state") == "error":
-                raise RuntimeError(f"Resource failed to load: {resource_data.get('lastError')}")
-                
-            ready = resource_data.get("state") == "ready"
-            if not ready:
-                await asyncio.sleep(3)
+        await self._wait_until_ready(
+            f"/api/v1/Agents({agent_id})/tools({tool_id})/resources({resource_id})",
+            "Resource failed to load"
+        )
     
-    async def _wait_for_tool_ready(self, tool_id: str):
+    async def _wait_for_tool_ready(self, agent_id: str, tool_id: str) -> Dict[str, Any]:
         """Wait for a tool to be ready
         
         Args:
+            agent_id: The agent ID
             tool_id: The tool ID
+            
+        Returns:
+            The tool details once it is ready
         """
-        client = await self._get_client()
-        ready = False
-        while not ready:
-            tool_response = await client.get(
-                f"/api/v1/Agents({self._agent_id})/tools({tool_id})"
-            )
-            tool_response.raise_for_status()
-            tool_data = tool_response.json()
+        return await self._wait_until_ready(
+            f"/api/v1/Agents({agent_id})/tools({tool_id})",
+            "Tool failed to load"
+        )
+    
+    async def _wait_until_ready(self, path: str, error_message: str,
+                                ready_without_state: bool = False) -> Dict[str, Any]:
+        """Poll an entity until its state is "ready"
+        
+        The first checks come quickly so entities that are ready almost at once
+        aren't held up; the delay then doubles up to READY_POLL_MAX_DELAY.
+        
+        Args:
+            path: The entity's API path
+            error_message: Message for the error raised if the entity fails
+            ready_without_state: Treat an entity without a state field as ready
             
-            if tool_data.get("state") == "error":
-                raise RuntimeError(f"Tool failed to load: {tool_data.get('lastError')}")
-                
-            ready = tool_data.get("state") == "ready"
-            if not ready:
-                await asyncio.sleep(3)
+        Returns:
+            The entity once it is ready
+        """
+        delay = READY_POLL_INITIAL_DELAY
+        while True:
+            response = await self._request("GET", path)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            state = data.get("state")
+            if state == "error":
+                raise RuntimeError(f"{error_message}: {data.get('lastError')}")
+            if state == "ready" or (ready_without_state and "state" not in data):
+                return data
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, READY_POLL_MAX_DELAY)
     
     async def _create_chat(self, agent_id):
         """Create a new chat with a unique name
@@ -556,13 +1100,12 @@ class PABClient:
         Returns:
             The chat ID
         """
-        client = await self._get_client()
-        
         # Always create a new chat with a unique name
         unique_name = f"Chat Session {uuid.uuid4()}"
         
         try:
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 f"/api/v1/Agents({agent_id})/chats",
                 json={"name": unique_name}
             )
@@ -574,7 +1117,8 @@ class PABClient:
             logger.error(f"Error creating chat: {e}")
             # Try again with an even more unique name
             more_unique_name = f"Chat {time.time()} {uuid.uuid4()}"
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 f"/api/v1/Agents({agent_id})/chats",
                 json={"name": more_unique_name}
             )
@@ -598,7 +1142,9 @@ class PABClient:
         preprocessing_enabled: bool = False,
         postprocessing_enabled: bool = False,
         orchestration_module_config: dict = None,
-        chat_id: str = None
+        chat_id: str = None,
+        initial_tools: List[Dict[str, Any]] = None,
+        initial_documents: List[Dict[str, Any]] = None
     ):
         """Create a PAB agent and return an interface
         
@@ -617,6 +1163,9 @@ class PABClient:
             postprocessing_enabled: Whether postprocessing is enabled (default: False)
             orchestration_module_config: Configuration for orchestration modules (default: None)
             chat_id: Optional chat ID to continue a previous conversation (default: None)
+            initial_tools: Tools to add, as add_tools specifications (default: None)
+            initial_documents: Documents to add, each holding the add_document arguments,
+                e.g. {"doc_name": "faq.txt", "content": text} (default: None)
             
         Returns:
             AgentInterface: An interface for interacting with the agent
@@ -655,30 +1204,39 @@ class PABClient:
             logger.info(f"Found existing agent with name '{unique_name}' (ID: {existing_agent_id})")
             # Update the existing agent instead of deleting it
             await self._update_agent(existing_agent_id, agent_config)
-            self._agent_id = existing_agent_id
+            agent_id = existing_agent_id
         else:
             # Create a new agent
             try:
-                response = await client.post("/api/v1/Agents", json=agent_config)
+                response = await self._request("POST", "/api/v1/Agents", json=agent_config)
                 response.raise_for_status()
-                self._agent_id = response.json()["ID"]
-                logger.info(f"Created new agent with ID: {self._agent_id}")
+                agent_id = response.json()["ID"]
+                logger.info(f"Created new agent with ID: {agent_id}")
             except Exception as e:
                 logger.error(f"Error creating agent: {e}")
                 # Try one more time after a delay
                 await asyncio.sleep(5)
-                response = await client.post("/api/v1/Agents", json=agent_config)
+                response = await self._request("POST", "/api/v1/Agents", json=agent_config)
                 response.raise_for_status()
-                self._agent_id = response.json()["ID"]
-                logger.info(f"Created new agent on second attempt with ID: {self._agent_id}")
+                agent_id = response.json()["ID"]
+                logger.info(f"Created new agent on second attempt with ID: {agent_id}")
+        self._agent_id = agent_id
+        # Tools recorded for an existing agent of this name predate its update
+        self._agents[agent_id] = _AgentState([{k: v for k, v in agent_config.items() if k != "name"}])
         
         # Wait for the agent to be ready
-        await self._wait_for_agent_ready(self._agent_id)
+        await self._wait_for_agent_ready(agent_id)
         
         # Create agent interface with optional chat ID
-        agent_interface = AgentInterface(self, client, chat_id)
-        # Initialize the interface (creates a new chat if chat_id is None)
-        await agent_interface.initialize()
+        agent_interface = AgentInterface(self, client, chat_id, agent_id=agent_id)
+        # Initialize the interface (creates a new chat if chat_id is None); the
+        # chat and the initial tools only need the agent, so set them up together
+        await asyncio.gather(
+            agent_interface.initialize(),
+            *(self._add_tool(agent_id, **spec) for spec in initial_tools or [])
+        )
+        if initial_documents:
+            await asyncio.gather(*(agent_interface.add_document(**doc) for doc in initial_documents))
         
         return agent_interface
         
@@ -727,7 +1285,7 @@ class PABClient:
                 return agent_interface
                 
             async def __aexit__(self, exc_type, exc_val, exc_tb):
-                await self.client.aclose()
+                await self.pab_client.aclose()
                 
         return AgentRunContext(self, client, chat_id)
 
@@ -752,7 +1310,7 @@ class PABClient:
         
         # Verify the agent exists
         try:
-            agent_response = await client.get(f"/api/v1/Agents({agent_id})")
+            agent_response = await self._request("GET", f"/api/v1/Agents({agent_id})")
             agent_response.raise_for_status()
             agent_data = agent_response.json()
             logger.info(f"Found existing agent: {agent_data.get('name', 'Unnamed')}")
@@ -771,7 +1329,7 @@ class PABClient:
                 raise
         
         # Create agent interface with optional chat ID
-        agent_interface = AgentInterface(self, client, chat_id)
+        agent_interface = AgentInterface(self, client, chat_id, agent_id=agent_id)
         # Initialize the interface (creates a new chat if chat_id is None)
         await agent_interface.initialize()
         
@@ -783,38 +1341,44 @@ class PABClient:
         Args:
             agent_id: The agent ID to check
         """
-        client = await self._get_client()
-        ready = False
-        
-        while not ready:
-            agent_response = await client.get(f"/api/v1/Agents({agent_id})")
-            agent_response.raise_for_status()
-            agent_data = agent_response.json()
-            
-            if agent_data.get("state") == "error":
-                raise RuntimeError(f"Agent failed to initialize: {agent_data.get('lastError')}")
-                
-            ready = agent_data.get("state") == "ready" or "state" not in agent_data
-            if not ready:
-                await asyncio.sleep(3)
-                
+        await self._wait_until_ready(
+            f"/api/v1/Agents({agent_id})",
+            "Agent failed to initialize",
+            ready_without_state=True
+        )
         logger.info("Agent is now ready")
 
 
 class AgentInterface:
-    """Interface for interacting with a PAB Agent"""
+    """Interface for interacting with a PAB Agent
     
-    def __init__(self, pab_client: PABClient, client: httpx.AsyncClient, chat_id: str = None):
+    Each interface talks to its own chat, so several interfaces for the same
+    agent can be used concurrently.
+    """
+    
+    def __init__(self, pab_client: PABClient, client: httpx.AsyncClient, chat_id: str = None,
+                 agent_id: str = None):
         """Initialize the agent interface
         
         Args:
             pab_client: The parent PAB Client
             client: The HTTP client
             chat_id: Optional chat ID to continue a previous conversation. If None, a new chat will be created.
+            agent_id: The agent to talk to (default: the PAB Client's current agent)
         """
         self.pab_client = pab_client
         self.client = client
+        self.agent_id = agent_id or pab_client._agent_id
+        # This agent's tools and documents; they stay with this interface even
+        # after the PAB Client moves on to another agent
+        self._agent = pab_client._agent_state(self.agent_id) if self.agent_id else None
         self.chat_id = chat_id
+        self._chat_path = None
+        # Messages sent in this chat, for the response cache key; None when
+        # continuing a chat whose earlier messages are unknown
+        self._history = None
+        # Messages answered from the response cache that the server hasn't seen yet
+        self._unsent = []
         
     async def initialize(self):
         """Initialize the interface by setting up the chat
@@ -827,23 +1391,30 @@ class AgentInterface:
         """
         # If no chat ID was provided, create a new chat
         if not self.chat_id:
-            self.pab_client._chat_id = await self.pab_client._create_chat(self.pab_client._agent_id)
+            self.chat_id = await self.pab_client._create_chat(self.agent_id)
+            self._history = []
         else:
-            # Use the provided chat ID
-            self.pab_client._chat_id = self.chat_id
             # Verify that the chat exists
             try:
-                chat_response = await self.client.get(
-                    f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.chat_id})"
+                chat_response = await self.pab_client._request(
+                    "GET",
+                    f"/api/v1/Agents({self.agent_id})/chats({self.chat_id})"
                 )
                 chat_response.raise_for_status()
                 logger.info(f"Using existing chat with ID: {self.chat_id}")
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
                     logger.info(f"Chat with ID {self.chat_id} not found. Creating a new chat.")
-                    self.pab_client._chat_id = await self.pab_client._create_chat(self.pab_client._agent_id)
+                    self.chat_id = await self.pab_client._create_chat(self.agent_id)
+                    self._history = []
                 else:
                     raise
+        # Keep the client pointing at the most recently initialized chat
+        self.pab_client._chat_id = self.chat_id
+        # Every message call uses these, so build them once per chat
+        self._chat_path = f"/api/v1/Agents({self.agent_id})/chats({self.chat_id})"
+        self._send_path = f"{self._chat_path}/UnifiedAiAgentService.sendMessage"
+        self._state_path = f"{self._chat_path}?$select=state"
         return self
         
     async def send_message(self, message: str, output_format: OutputFormat = OutputFormat.MARKDOWN, 
@@ -864,6 +1435,10 @@ class AgentInterface:
                      output_format_options: str = None) -> str:
         """Send a message to the agent
         
+        With PAB_RESPONSE_CACHE=1 set, a response is reused when the same message
+        was sent before to an identically configured agent in a chat with the same
+        earlier messages.
+        
         Args:
             message: The message to send
             output_format: The output format (OutputFormat.MARKDOWN, OutputFormat.TEXT, or OutputFormat.JSON)
@@ -872,38 +1447,104 @@ class AgentInterface:
         Returns:
             The agent's response
         """
-        if not self.pab_client._agent_id or not self.pab_client._chat_id:
+        if not self.agent_id or not self.chat_id:
             raise ValueError("Agent or chat not initialized")
-            
+        
+        cache = self.pab_client._response_cache if self._history is not None else None
+        if cache is None:
+            await self._send_unsent()
+            self._history = None
+            return await self._send(message, output_format, output_format_options)
+        
+        loop = asyncio.get_running_loop()
+        sent = [message, output_format, output_format_options]
+        key = self._cache_key(self._history, sent)
+        response = await loop.run_in_executor(None, cache.get, key)
+        if response is not None:
+            self._history.append(sent)
+            self._unsent.append(sent)
+            return response
+        
+        # The server's chat must hold the earlier messages before it can answer this one
+        await self._send_unsent()
+        response = await self._send(message, output_format, output_format_options)
+        self._history.append(sent)
+        await loop.run_in_executor(None, cache.set, key, response)
+        return response
+    
+    async def _send_independent(self, message: str, output_format: OutputFormat,
+                                output_format_options: str) -> str:
+        """Send a message whose answer doesn't depend on the chat's earlier messages
+        
+        batch() sends its messages this way. Cached answers are keyed without
+        the chat's history, so a hit doesn't depend on which chat the message
+        was given to, and a miss needs no cached messages resent first.
+        """
+        cache = self.pab_client._response_cache
+        if cache is None:
+            return await self._send(message, output_format, output_format_options)
+        
+        loop = asyncio.get_running_loop()
+        key = self._cache_key(None, [message, output_format, output_format_options])
+        response = await loop.run_in_executor(None, cache.get, key)
+        if response is None:
+            response = await self._send(message, output_format, output_format_options)
+            await loop.run_in_executor(None, cache.set, key, response)
+        return response
+    
+    def _cache_key(self, history: Optional[List[list]], sent: list) -> str:
+        """Response cache key for a message sent to this agent after history (None: any history)"""
+        return hashlib.sha256(orjson.dumps(
+            [self.pab_client._api_url, self.pab_client._client_id,
+             self._agent.fingerprint, history, sent],
+            default=str
+        )).hexdigest()
+    
+    async def _send_unsent(self):
+        """Send the messages that were answered from the response cache to the server's chat
+        
+        The server answers them again, so a chat that misses the cache after
+        earlier hits costs a round trip per replayed message.
+        """
+        if self._unsent:
+            logger.warning(
+                f"Response cache miss after {len(self._unsent)} cached answer(s) in chat {self.chat_id}; "
+                "resending those messages so the chat has their context"
+            )
+        while self._unsent:
+            await self._send(*self._unsent[0])
+            self._unsent.pop(0)
+    
+    async def _send(self, message: str, output_format: OutputFormat, output_format_options: str) -> str:
+        """Send a message to the server and wait for the agent's response"""
         # Send the message
-        response = await self.client.post(
-            f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})/UnifiedAiAgentService.sendMessage",
-            json={
+        response = await self.pab_client._request(
+            "POST",
+            self._send_path,
+            content=orjson.dumps({
                 "msg": message,
                 "outputFormat": output_format.value if isinstance(output_format, OutputFormat) else output_format,
                 "outputFormatOptions": output_format_options,
                 "async": True
-            }
+            }),
+            headers=JSON_HEADERS
         )
         response.raise_for_status()
-        history_id = response.json()["historyId"]
+        history_id = orjson.loads(response.content)["historyId"]
         
         # Poll for the response
+        answers_path = f"{self._chat_path}/history?$filter=previous/ID eq {history_id}"
         while True:
-            answers_response = await self.client.get(
-                f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})/history?$filter=previous/ID eq {history_id}"
-            )
+            answers_response = await self.pab_client._request("GET", answers_path)
             answers_response.raise_for_status()
-            answers = answers_response.json().get("value", [])
+            answers = orjson.loads(answers_response.content).get("value", [])
             
             # No answer yet
             if not answers:
                 # Check if chat is in error state
-                chat_response = await self.client.get(
-                    f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})?$select=state"
-                )
+                chat_response = await self.pab_client._request("GET", self._state_path)
                 chat_response.raise_for_status()
-                chat_data = chat_response.json()
+                chat_data = orjson.loads(chat_response.content)
                 
                 if chat_data.get("state") == "failed":
                     raise RuntimeError("Chat failed")
@@ -914,19 +1555,120 @@ class AgentInterface:
             # Got an answer
             return answers[0]["content"]
             
+    async def batch(self, messages: List[str], output_format: OutputFormat = OutputFormat.MARKDOWN,
+                    output_format_options: str = None, concurrency: int = 8,
+                    return_exceptions: bool = False) -> List[Any]:
+        """Send several independent messages to the agent concurrently
+        
+        A chat handles one message at a time, so up to `concurrency` chats are used:
+        this interface's chat plus new chats with the same agent. Each chat takes
+        the next waiting message as soon as it has answered its previous one.
+        With the response cache on, each message is looked up on its own,
+        whichever chat it goes to, and this interface's chat stops using the
+        cache for later messages.
+        
+        Args:
+            messages: The messages to send
+            output_format: The output format for every message
+            output_format_options: Additional format options
+            concurrency: Most messages in flight at once
+            return_exceptions: Return a failed message's exception in its slot
+                instead of raising it
+            
+        Returns:
+            The agent's responses, in the same order as messages
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        # This chat is about to hold messages outside its cached history
+        await self._send_unsent()
+        self._history = None
+        
+        responses: List[Any] = [None] * len(messages)
+        pending = iter(enumerate(messages))
+        
+        async def work(interface: "AgentInterface"):
+            for index, message in pending:
+                try:
+                    responses[index] = await interface._send_independent(
+                        message, output_format, output_format_options
+                    )
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    responses[index] = e
+        
+        workers = min(concurrency, len(messages))
+        chat_tasks = [asyncio.ensure_future(self._new_chat()) for _ in range(workers - 1)]
+        try:
+            await _wait_or_cancel(chat_tasks)
+            interfaces = [self] + [task.result() for task in chat_tasks]
+            await _wait_or_cancel([asyncio.ensure_future(work(interface)) for interface in interfaces])
+            return responses
+        finally:
+            # The extra chats only served this batch
+            await asyncio.gather(*(
+                task.result()._delete_chat() for task in chat_tasks
+                if task.done() and not task.cancelled() and task.exception() is None
+            ))
+    
+    async def _delete_chat(self):
+        """Delete this interface's chat on the server, logging instead of raising on failure"""
+        try:
+            response = await self.pab_client._request("DELETE", self._chat_path)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not delete chat {self.chat_id}: {e}")
+    
+    async def _new_chat(self) -> "AgentInterface":
+        """Create an interface for a new chat with the same agent
+        
+        Returns:
+            AgentInterface: The initialized interface
+        """
+        interface = AgentInterface(self.pab_client, self.client, agent_id=self.agent_id)
+        return await interface.initialize()
+    
     async def interactive(self):
-        """Start an interactive chat session with the agent"""
+        """Start an interactive chat session with the agent
+        
+        While waiting for the user to type, the pooled connection is kept warm
+        in the background so the next message doesn't pay for a new handshake.
+        """
         logger.info(f"Starting interactive chat with {self.pab_client.name}. Type 'exit' to quit.")
-        while True:
-            user_input = input("\nYou: ")
-            if user_input.lower() in ("exit", "quit"):
-                break
+        loop = asyncio.get_running_loop()
+        keep_alive = asyncio.ensure_future(self._keep_alive())
+        try:
+            while True:
+                # Read input off the event loop so the keep-alive task can run
+                user_input = await loop.run_in_executor(None, input, "\nYou: ")
+                if user_input.lower() in ("exit", "quit"):
+                    break
+                    
+                try:
+                    response = await self(user_input)
+                    logger.info(f"\nAgent: {response}")
+                except Exception as e:
+                    logger.error(f"\nError: {e}")
+        finally:
+            keep_alive.cancel()
                 
+    async def _keep_alive(self, interval: float = KEEP_ALIVE_INTERVAL):
+        """Periodically make a cheap request so idle pooled connections stay open
+        
+        Args:
+            interval: Seconds between requests
+        """
+        while True:
+            await asyncio.sleep(interval)
             try:
-                response = await self(user_input)
-                logger.info(f"\nAgent: {response}")
-            except Exception as e:
-                logger.error(f"\nError: {e}")
+                await self.pab_client._request("GET", self._state_path)
+            except httpx.HTTPError as e:
+                logger.debug(f"Keep-alive request failed: {e}")
                 
     async def continue_message(self, history_id: str, observation: str) -> str:
         """Continue a message that was interrupted by a tool
@@ -938,36 +1680,39 @@ class AgentInterface:
         Returns:
             The agent's response
         """
-        if not self.pab_client._agent_id or not self.pab_client._chat_id:
+        if not self.agent_id or not self.chat_id:
             raise ValueError("Agent or chat not initialized")
+        
+        # The chat now holds more than its messages, so stop using the response cache
+        await self._send_unsent()
+        self._history = None
             
         # Send the continuation
-        response = await self.client.post(
-            f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})/UnifiedAiAgentService.continueMessage",
-            json={
+        response = await self.pab_client._request(
+            "POST",
+            f"{self._chat_path}/UnifiedAiAgentService.continueMessage",
+            content=orjson.dumps({
                 "observation": observation,
                 "historyId": history_id,
                 "async": True
-            }
+            }),
+            headers=JSON_HEADERS
         )
         response.raise_for_status()
         
         # Poll for the response
+        answers_path = f"{self._chat_path}/history?$filter=previous/ID eq {history_id}"
         while True:
-            answers_response = await self.client.get(
-                f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})/history?$filter=previous/ID eq {history_id}"
-            )
+            answers_response = await self.pab_client._request("GET", answers_path)
             answers_response.raise_for_status()
-            answers = answers_response.json().get("value", [])
+            answers = orjson.loads(answers_response.content).get("value", [])
             
             # No answer yet
             if not answers:
                 # Check if chat is in error state
-                chat_response = await self.client.get(
-                    f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})?$select=state"
-                )
+                chat_response = await self.pab_client._request("GET", self._state_path)
                 chat_response.raise_for_status()
-                chat_data = chat_response.json()
+                chat_data = orjson.loads(chat_response.content)
                 
                 if chat_data.get("state") == "failed":
                     raise RuntimeError("Chat failed")
@@ -980,11 +1725,12 @@ class AgentInterface:
             
     async def cancel(self):
         """Cancel the current chat"""
-        if not self.pab_client._agent_id or not self.pab_client._chat_id:
+        if not self.agent_id or not self.chat_id:
             raise ValueError("Agent or chat not initialized")
             
-        response = await self.client.post(
-            f"/api/v1/Agents({self.pab_client._agent_id})/chats({self.pab_client._chat_id})/UnifiedAiAgentService.cancel",
+        response = await self.pab_client._request(
+            "POST",
+            f"{self._chat_path}/UnifiedAiAgentService.cancel",
             json={}
         )
         response.raise_for_status()
@@ -999,16 +1745,16 @@ class AgentInterface:
             True if document was removed, False if it wasn't found
         """
         tool_name = "document"
-        if tool_name not in self.pab_client._tools:
+        if tool_name not in self._agent.tools:
             logger.info(f"Document tool not found.")
             return False
             
-        tool_id = self.pab_client._tools[tool_name]
+        tool_id = self._agent.tools[tool_name]
         
         # List all resources to find the document by name
-        client = self.client
-        response = await client.get(
-            f"/api/v1/Agents({self.pab_client._agent_id})/tools({tool_id})/resources"
+        response = await self.pab_client._request(
+            "GET",
+            f"/api/v1/Agents({self.agent_id})/tools({tool_id})/resources"
         )
         response.raise_for_status()
         resources = response.json().get("value", [])
@@ -1025,8 +1771,9 @@ class AgentInterface:
             return False
             
         # Delete the document
-        delete_response = await client.delete(
-            f"/api/v1/Agents({self.pab_client._agent_id})/tools({tool_id})/resources({resource_id})"
+        delete_response = await self.pab_client._request(
+            "DELETE",
+            f"/api/v1/Agents({self.agent_id})/tools({tool_id})/resources({resource_id})"
         )
         delete_response.raise_for_status()
         logger.info(f"Removed document '{doc_name}' (ID: {resource_id}).")
@@ -1039,21 +1786,37 @@ class AgentInterface:
             List of documents with their details
         """
         tool_name = "document"
-        if tool_name not in self.pab_client._tools:
+        if tool_name not in self._agent.tools:
             logger.info(f"Document tool not found.")
             return []
             
-        tool_id = self.pab_client._tools[tool_name]
+        tool_id = self._agent.tools[tool_name]
         
         # List all resources
-        client = self.client
-        response = await client.get(
-            f"/api/v1/Agents({self.pab_client._agent_id})/tools({tool_id})/resources"
+        response = await self.pab_client._request(
+            "GET",
+            f"/api/v1/Agents({self.agent_id})/tools({tool_id})/resources"
         )
         response.raise_for_status()
         resources = response.json().get("value", [])
         
         return resources
+    
+    async def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the agent's tools and documents together
+        
+        Both lists are fetched concurrently once the document tool is known;
+        otherwise the tools are listed first to find it.
+        
+        Returns:
+            Dictionary with "tools" and "documents" lists
+        """
+        if "document" in self._agent.tools:
+            tools, documents = await asyncio.gather(self.list_tools(), self.list_documents())
+        else:
+            tools = await self.list_tools()
+            documents = await self.list_documents()
+        return {"tools": tools, "documents": documents}
         
     async def get_document_content(self, doc_name: str) -> Optional[str]:
         """Get the content of a document by name
@@ -1065,33 +1828,21 @@ class AgentInterface:
             The document content as a string, or None if not found
         """
         tool_name = "document"
-        if tool_name not in self.pab_client._tools:
+        if tool_name not in self._agent.tools:
             logger.info(f"Document tool not found.")
             return None
             
-        tool_id = self.pab_client._tools[tool_name]
+        tool_id = self._agent.tools[tool_name]
         
-        # List all resources to find the document by name
-        client = self.client
+        # List all resources to find the document by name; _request retries
+        # transient errors such as 503
         try:
-            retry_count = 0
-            max_retries = 3
-            while retry_count < max_retries:
-                try:
-                    response = await client.get(
-                        f"/api/v1/Agents({self.pab_client._agent_id})/tools({tool_id})/resources",
-                        timeout=30.0  # Increase timeout
-                    )
-                    response.raise_for_status()
-                    break  # Success - exit the retry loop
-                except httpx.HTTPStatusError as e:
-                    retry_count += 1
-                    if e.response.status_code == 503 and retry_count < max_retries:
-                        wait_time = 2 ** retry_count  # Exponential backoff
-                        logger.info(f"Server returned 503 error. Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise  # Re-raise if max retries or different error
+            response = await self.pab_client._request(
+                "GET",
+                f"/api/v1/Agents({self.agent_id})/tools({tool_id})/resources",
+                timeout=30.0  # Increase timeout
+            )
+            response.raise_for_status()
             
             resources = response.json().get("value", [])
             
@@ -1106,96 +1857,88 @@ class AgentInterface:
                 logger.info(f"Document '{doc_name}' not found.")
                 return None
                 
-            # Get the document content with retry
-            retry_count = 0
-            while retry_count < max_retries:
-                try:
-                    logger.info(f"Fetching document content (attempt {retry_count + 1})...")
-                    # Use standard endpoint instead of $value
-                    content_response = await client.get(
-                        f"/api/v1/Agents({self.pab_client._agent_id})/tools({tool_id})/resources({resource_id})",
-                        timeout=60.0  # Longer timeout for content
-                    )
-                    content_response.raise_for_status()
-                    
-                    # Parse the JSON response and extract the data field
-                    resource_data = content_response.json()
-                    data = resource_data.get("data")
-                    
-                    if not data:
-                        logger.info(f"No data field found in resource response.")
-                        return None
-                    
-                    # Decode base64 data
-                    try:
-                        decoded_content = base64.b64decode(data).decode('utf-8')
-                        return decoded_content
-                    except Exception as e:
-                        logger.error(f"Error decoding document content: {str(e)}")
-                        return None
-                except httpx.HTTPStatusError as e:
-                    retry_count += 1
-                    if e.response.status_code == 503 and retry_count < max_retries:
-                        wait_time = 2 ** retry_count
-                        logger.info(f"Server returned 503 error. Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.error(f"Error fetching document content: {e}")
-                        logger.error(f"Status code: {e.response.status_code}")
-                        logger.error(f"Response body: {e.response.text}")
-                        raise
+            # Get the document content
+            logger.info("Fetching document content...")
+            try:
+                # Use standard endpoint instead of $value
+                content_response = await self.pab_client._request(
+                    "GET",
+                    f"/api/v1/Agents({self.agent_id})/tools({tool_id})/resources({resource_id})",
+                    timeout=60.0  # Longer timeout for content
+                )
+                content_response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Error fetching document content: {e}")
+                logger.error(f"Status code: {e.response.status_code}")
+                logger.error(f"Response body: {e.response.text}")
+                raise
+            
+            # Parse the JSON response and extract the data field
+            resource_data = content_response.json()
+            data = resource_data.get("data")
+            
+            if not data:
+                logger.info(f"No data field found in resource response.")
+                return None
+            
+            # Decode base64 data
+            try:
+                return base64.b64decode(data).decode('utf-8')
+            except Exception as e:
+                logger.error(f"Error decoding document content: {str(e)}")
+                return None
         except Exception as e:
             logger.error(f"Error accessing document: {str(e)}")
             raise
-            
-        return None
 
     async def list_tools(self) -> List[Dict[str, Any]]:
         """List all tools associated with the agent
         
+        The list is fetched once and then kept up to date by add_tool. Call
+        invalidate_tools() if tools are changed outside this client.
+        
         Returns:
             List of tools with their details (ID, name, state, type, etc.)
         """
-        if not self.pab_client._agent_id:
+        if not self.agent_id:
             raise ValueError("Agent not initialized")
+        
+        if self._agent.tool_list is not None:
+            return list(self._agent.tool_list)
             
-        # Get a client
-        client = self.client
+        generation = self._agent.tool_list_generation
         
         try:
-            retry_count = 0
-            max_retries = 3
+            # _request retries transient errors such as 503
+            response = await self.pab_client._request(
+                "GET",
+                f"/api/v1/Agents({self.agent_id})/tools",
+                timeout=30.0  # Reasonable timeout
+            )
+            response.raise_for_status()
             
-            while retry_count < max_retries:
-                try:
-                    response = await client.get(
-                        f"/api/v1/Agents({self.pab_client._agent_id})/tools",
-                        timeout=30.0  # Reasonable timeout
-                    )
-                    response.raise_for_status()
-                    break  # Success - exit the retry loop
-                except httpx.HTTPStatusError as e:
-                    retry_count += 1
-                    if e.response.status_code == 503 and retry_count < max_retries:
-                        wait_time = 2 ** retry_count  # Exponential backoff
-                        logger.info(f"Server returned 503 error. Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise  # Re-raise if max retries or different error
-                        
             # Parse response and return tools list
             tools = response.json().get("value", [])
             
+            # Tools changed (or were invalidated) while fetching; don't cache the result
+            if self._agent.tool_list_generation != generation:
+                return list(tools)
+            
             # Update internal tools dictionary with IDs for later use
             for tool in tools:
                 if "name" in tool and "ID" in tool:
-                    self.pab_client._tools[tool["name"]] = tool["ID"]
-                    
-            return tools
+                    self._agent.tools[tool["name"]] = tool["ID"]
+            
+            self._agent.tool_list = tools
+            return list(tools)
         except Exception as e:
             logger.error(f"Error listing tools: {str(e)}")
             raise
 
+    def invalidate_tools(self):
+        """Forget the cached tool list so the next list_tools() call fetches it again"""
+        self._agent.invalidate_tool_list()
+
     async def get_tool_names(self) -> List[str]:
         """Get just the names of all tools associated with the agent
         
@@ -1223,26 +1966,29 @@ class AgentInterface:
         max_retries = 3
         retry_count = 0
         
-        # Check if the agent has the document tool
-        if "document" not in self.pab_client._tools:
-            # Create the document tool
-            logger.info(f"Document tool not found. Creating it...")
-            while retry_count < max_retries:
-                try:
-                    tool_id = await self.pab_client.add_tool(
-                        name="document",
-                        tool_type=ToolType.DOCUMENT
-                    )
-                    logger.info(f"Created document tool with ID: {tool_id}")
-                    break
-                except httpx.HTTPStatusError as e:
-                    retry_count += 1
-                    if e.response.status_code == 503 and retry_count < max_retries:
-                        wait_time = 2 ** retry_count
-                        logger.info(f"Server returned 503 error. Retrying tool creation in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise
+        # Check if the agent has the document tool. The lock keeps concurrent
+        # add_document calls from each creating their own document tool.
+        async with self._agent.document_tool_lock:
+            if "document" not in self._agent.tools:
+                # Create the document tool
+                logger.info(f"Document tool not found. Creating it...")
+                while retry_count < max_retries:
+                    try:
+                        tool_id = await self.pab_client._add_tool(
+                            self.agent_id,
+                            name="document",
+                            tool_type=ToolType.DOCUMENT
+                        )
+                        logger.info(f"Created document tool with ID: {tool_id}")
+                        break
+                    except httpx.HTTPStatusError as e:
+                        retry_count += 1
+                        if e.response.status_code == 503 and retry_count < max_retries:
+                            wait_time = 2 ** retry_count
+                            logger.info(f"Server returned 503 error. Retrying tool creation in {wait_time} seconds...")
+                            await asyncio.sleep(wait_time)
+                        else:
+                            raise
         
         # Reset retry counter for document addition
         retry_count = 0
@@ -1251,7 +1997,8 @@ class AgentInterface:
         while retry_count < max_retries:
             try:
                 logger.info(f"Adding document (attempt {retry_count + 1})...")
-                doc_id = await self.pab_client.add_document(
+                doc_id = await self.pab_client._add_document(
+                    self.agent_id,
                     doc_name=doc_name,
                     content=content,
                     content_type=content_type
@@ -6,14 +6,16 @@ allowing you to create and manage agents, chats, and messages.
 """
 
 from .client import AgentBuilderClient
+from .async_client import AsyncAgentBuilderClient
 from .models import (
     Agent, Chat, Message, Tool, Resource, 
     MessageRole, OutputFormat, ToolType, ResourceState, ChatState, ModelType, AgentType
 )
-from .exceptions import ApiError, AuthenticationError, ResourceNotReadyError, TimeoutError
+from .exceptions import ApiError, AuthenticationError, ResourceNotReadyError, SDKTimeoutError, TimeoutError
 
 __all__ = [
     'AgentBuilderClient',
+    'AsyncAgentBuilderClient',
     'Agent',
     'Chat',
     'Message',
@@ -29,5 +31,6 @@ __all__ = [
     'ApiError',
     'AuthenticationError',
     'ResourceNotReadyError',
+    'SDKTimeoutError',
     'TimeoutError'
 ] 
\ No newline at end of file
@@ -0,0 +1,351 @@
+"""
+Asynchronous client module for the BAF SDK.
+
+This module contains an asyncio-based variant of the main client that lets
+many conversations be polled concurrently over a shared connection pool.
+"""
+
+import asyncio
+import logging
+from typing import Iterable, List, Dict, Any, Optional
+
+import orjson
+
+from .client import AgentBuilderClient, _default, _odata_string, _POLL_BASE_DELAY
+from .models import Agent, Chat, Message, OutputFormat, ChatState
+from .exceptions import ApiError, SDKTimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAgentBuilderClient(AgentBuilderClient):
+    """
+    Asynchronous client for the Project Agent Builder API.
+
+    All synchronous methods of AgentBuilderClient remain available. The
+    ``*_async`` methods run on an ``aiohttp.ClientSession`` that is created
+    lazily on first use and shared by every coroutine of this client.
+
+    Requires the optional ``aiohttp`` dependency (``pip install pab-sdk[async]``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the asynchronous API client.
+
+        Accepts the same arguments as AgentBuilderClient.
+        """
+        super().__init__(*args, **kwargs)
+        self._async_session = None
+
+    async def _get_async_session(self):
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        Returns:
+            The aiohttp.ClientSession used for asynchronous requests
+        """
+        if self._async_session is None or self._async_session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=75)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._async_session
+
+    async def aclose(self) -> None:
+        """Close the asynchronous and synchronous HTTP sessions."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self.close()
+
+    async def __aenter__(self) -> "AsyncAgentBuilderClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an asynchronous API request.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            endpoint: API endpoint (relative to base URL)
+            data: Request data (for POST, PATCH)
+            params: Query parameters
+
+        Returns:
+            Response data as a dictionary
+
+        Raises:
+            ApiError: If the API returns an error
+            SDKTimeoutError: If the request exceeds the client's timeout
+        """
+        import aiohttp
+
+        if method not in ("GET", "POST", "PATCH", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        url = f"{self.api_base_url}{endpoint}"
+        # Token refresh uses blocking I/O, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        headers = await loop.run_in_executor(None, self._get_headers)
+
+        body = None
+        if data is not None:
+            body = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+        logger.debug("Making async API request: %s %s", method, url)
+
+        session = await self._get_async_session()
+        try:
+            async with session.request(method, url, headers=headers, data=body, params=params) as response:
+                raw = await response.read()
+                logger.debug("API Response Status Code: %s", response.status)
+
+                if response.status >= 400:
+                    error_data = None
+                    error_details = raw.decode("utf-8", errors="replace")
+                    try:
+                        error_data = orjson.loads(raw) if raw else None
+                    except orjson.JSONDecodeError:
+                        pass
+                    else:
+                        if isinstance(error_data, dict) and 'error' in error_data:
+                            error_details = f"{error_data.get('error')}: {error_data.get('message', '')}"
+
+                    full_error = f"{response.status} {response.reason} for url: {url}"
+                    if error_details:
+                        full_error = f"{full_error} - {error_details}"
+                    logger.error(f"API request failed: {full_error}")
+                    raise ApiError(
+                        f"API request failed: {full_error}",
+                        status_code=response.status,
+                        error_data=error_data
+                    )
+
+                if response.status == 204 or not raw:
+                    return {}
+
+                return orjson.loads(raw)
+
+        except aiohttp.ClientError as e:
+            logger.error(f"API request failed: {str(e)}")
+            raise ApiError(f"API request failed: {str(e)}") from e
+        except asyncio.TimeoutError as e:
+            # aiohttp signals its total timeout with a bare asyncio.TimeoutError
+            logger.error(f"API request timed out after {self.timeout} seconds: {method} {url}")
+            raise SDKTimeoutError(f"API request timed out after {self.timeout} seconds: {method} {url}") from e
+
+    async def get_agent_async(self, agent_id: str) -> Agent:
+        """
+        Get an agent by ID asynchronously.
+
+        Args:
+            agent_id: The ID of the agent
+
+        Returns:
+            Agent object
+        """
+        response = await self._make_request_async("GET", self._AGENT.format(agent_id))
+        return Agent.from_api_dict(response)
+
+    async def create_agent_async(self, agent: Agent) -> Agent:
+        """
+        Create a new agent or update an existing one with the same name, asynchronously.
+
+        Args:
+            agent: Agent object with configuration
+
+        Returns:
+            Created or updated Agent object with ID
+        """
+        response = await self._make_request_async(
+            "GET",
+            self._AGENTS,
+            params={"$filter": f"name eq {_odata_string(agent.name)}", "$top": 1}
+        )
+        existing = response.get("value", [])
+
+        if existing:
+            agent_id = existing[0].get("ID")
+            logger.info(f"Agent with name '{agent.name}' already exists (ID: {agent_id}). Updating instead.")
+            update_data = agent.to_api_dict()
+            update_data.pop("ID", None)
+            await self._make_request_async("PATCH", self._AGENT.format(agent_id), data=update_data)
+            return await self.get_agent_async(agent_id)
+
+        response = await self._make_request_async("POST", self._AGENTS, data=agent.to_api_dict())
+        if "name" in response:
+            return Agent.from_api_dict(response)
+        return await self.get_agent_async(response.get("ID"))
+
+    async def create_agents_async(self, agents: Iterable[Agent]) -> List[Agent]:
+        """
+        Create or update several agents concurrently.
+
+        The OAuth token is fetched once up front and all requests share the
+        client's connection pool. Agents with different names are handled
+        concurrently; agents that share a name are handled one after another
+        in the given order, so the first creates the agent and the later ones
+        update it instead of each creating a duplicate.
+
+        Args:
+            agents: Agent objects with configuration
+
+        Returns:
+            Created or updated Agent objects, in the same order as agents
+        """
+        agents = list(agents)
+        indexes_by_name: Dict[str, List[int]] = {}
+        for index, agent in enumerate(agents):
+            indexes_by_name.setdefault(agent.name, []).append(index)
+
+        results: List[Optional[Agent]] = [None] * len(agents)
+
+        async def create_in_order(indexes: List[int]) -> None:
+            for index in indexes:
+                results[index] = await self.create_agent_async(agents[index])
+
+        loop = asyncio.get_running_loop()
+        # Warm the token so concurrent requests don't each trigger a refresh
+        await loop.run_in_executor(None, self._get_headers)
+        await asyncio.gather(*(create_in_order(indexes) for indexes in indexes_by_name.values()))
+        return results
+
+    async def get_chat_async(self, agent_id: str, chat_id: str) -> Chat:
+        """
+        Get a chat by ID asynchronously.
+
+        Args:
+            agent_id: The ID of the agent
+            chat_id: The ID of the chat
+
+        Returns:
+            Chat object
+        """
+        response = await self._make_request_async("GET", self._CHAT.format(agent_id, chat_id))
+        return Chat.from_api_dict(response)
+
+    async def list_messages_async(self, agent_id: str, chat_id: str) -> List[Message]:
+        """
+        Get a list of all messages in a chat asynchronously.
+
+        Args:
+            agent_id: The ID of the agent
+            chat_id: The ID of the chat
+
+        Returns:
+            List of Message objects
+        """
+        response = await self._make_request_async("GET", self._HISTORY.format(agent_id, chat_id))
+        return [Message.from_api_dict(message_data) for message_data in response.get("value", [])]
+
+    async def send_message_async(
+        self,
+        agent_id: str,
+        chat_id: str,
+        message: str,
+        output_format: OutputFormat = OutputFormat.MARKDOWN,
+        output_format_options: str = "",
+        return_trace: bool = False
+    ) -> str:
+        """
+        Send a message to an agent asynchronously.
+
+        The message is always processed in async mode on the server; use
+        wait_for_message_response_async to await the answer.
+
+        Args:
+            agent_id: The ID of the agent
+            chat_id: The ID of the chat
+            message: The message text
+            output_format: Desired output format
+            output_format_options: Additional format options
+            return_trace: Whether to return the trace
+
+        Returns:
+            The history ID of the sent message
+        """
+        data = {
+            "msg": message,
+            "outputFormat": output_format.value,
+            "async": True,
+            "returnTrace": return_trace
+        }
+
+        if output_format_options:
+            data["outputFormatOptions"] = output_format_options
+
+        response = await self._make_request_async(
+            "POST",
+            self._CHAT_ACTION.format(agent_id, chat_id, "sendMessage"),
+            data=data
+        )
+        return response.get("historyId")
+
+    async def wait_for_message_response_async(
+        self,
+        agent_id: str,
+        chat_id: str,
+        history_id: str,
+        max_attempts: int = 60,
+        interval: int = 3
+    ) -> Message:
+        """
+        Wait for a response to an asynchronous message without blocking the event loop.
+
+        The answer lookup and chat state check are issued concurrently on each poll.
+
+        Args:
+            agent_id: The ID of the agent
+            chat_id: The ID of the chat
+            history_id: The history ID of the sent message
+            max_attempts: Maximum number of polling attempts
+            interval: Maximum polling interval in seconds (polling backs off up to it)
+
+        Returns:
+            Message object containing the agent's response
+
+        Raises:
+            ApiError: If the chat fails
+            SDKTimeoutError: If max_attempts is reached
+        """
+        for attempt in range(max_attempts):
+            logger.debug("Polling for response to history ID %s (Attempt %d/%d)", history_id, attempt + 1, max_attempts)
+            answers, chat_data = await asyncio.gather(
+                self._make_request_async(
+                    "GET",
+                    self._HISTORY.format(agent_id, chat_id),
+                    params={"$filter": f"previous/ID eq {history_id}", "$top": 1}
+                ),
+                self._make_request_async("GET", self._CHAT.format(agent_id, chat_id), params={"$select": "state"})
+            )
+
+            values = answers.get("value", [])
+            if values:
+                message = Message.from_api_dict(values[0])
+                logger.info("Found response message %s for history ID %s", message.id, history_id)
+                return message
+
+            chat = Chat.from_api_dict(chat_data)
+            if chat.state == ChatState.FAILED:
+                logger.error(f"Chat {chat_id} entered FAILED state while waiting for response.")
+                raise ApiError("Chat processing failed")
+
+            delay = min(interval, _POLL_BASE_DELAY * 2 ** attempt)
+            logger.debug("No response yet for %s, waiting %ss...", history_id, delay)
+            await asyncio.sleep(delay)
+
+        logger.error(f"No response received for history ID {history_id} after {max_attempts} attempts")
+        raise SDKTimeoutError(f"No response received after {max_attempts} attempts")
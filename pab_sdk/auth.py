@@ -6,6 +6,7 @@ This module handles OAuth token acquisition and refresh.
 
 import time
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Optional
 
@@ -20,6 +21,8 @@ class TokenManager:
     Manages OAuth tokens for the BAF SDK.
     
     This class handles token acquisition, caching, and automatic refresh.
+    It is thread-safe: when the token expires, only one thread refreshes it
+    and the others wait for the new token.
     """
     
     def __init__(self, auth_url: str, client_id: str, client_secret: str):
@@ -36,6 +39,7 @@ class TokenManager:
         self.client_secret = client_secret
         self._token: Optional[str] = None
         self._expires_at: Optional[float] = None
+        self._lock = threading.Lock()
     
     def get_token(self) -> str:
         """
@@ -51,11 +55,23 @@ class TokenManager:
             AuthenticationError: If token acquisition fails
         """
         # Check if we need a new token (if current one is missing or about to expire)
-        if not self._token or not self._expires_at or self._expires_at <= time.time() + 60:
-            self._refresh_token()
+        if self._needs_refresh():
+            with self._lock:
+                # Another thread may have refreshed it while this one waited
+                if self._needs_refresh():
+                    self._refresh_token()
             
         return self._token
     
+    def _needs_refresh(self) -> bool:
+        """
+        Check whether the current token is missing or about to expire.
+        
+        Returns:
+            True if a new token must be obtained
+        """
+        return not self._token or not self._expires_at or self._expires_at <= time.time() + 60
+    
     def _refresh_token(self) -> None:
         """
         Obtain a new OAuth token from the authorization server.
@@ -5,14 +5,25 @@ This module contains the main client class that provides access to the
 Project Agent Builder API.
 """
 
-import json
+import functools
 import logging
 import os
+import socket
 import time
-from typing import List, Dict, Any, Optional, Union, Tuple
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Union, Tuple, TypeVar
 
+import orjson
 import requests
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib base64 module
+    import pybase64 as base64
+except ImportError:
+    import base64
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 from .auth import TokenManager, AuthenticationError
@@ -20,11 +31,89 @@ from .models import (
     Agent, Chat, Message, Tool, Resource,
     MessageRole, OutputFormat, ToolType, ResourceState, ChatState
 )
-from .exceptions import ApiError, ResourceNotReadyError, TimeoutError
+from .exceptions import ApiError, ResourceNotReadyError, SDKTimeoutError
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# First delay used by the wait_for_* polling loops; it doubles up to the interval
+_POLL_BASE_DELAY = 0.25
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv(dotenv_path: Optional[str] = None) -> None:
+    """
+    Load environment variables from a .env file once per process and path.
+    
+    Args:
+        dotenv_path: Optional path to .env file
+    """
+    load_dotenv(dotenv_path=dotenv_path)
+
+
+@functools.lru_cache(maxsize=512)
+def _snake_to_camel(key: str) -> str:
+    """
+    Convert a snake_case keyword to the camelCase field name used by the API.
+    
+    Args:
+        key: The snake_case key
+        
+    Returns:
+        The camelCase key
+    """
+    parts = key.split('_')
+    return parts[0] + ''.join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def _odata_string(value: str) -> str:
+    """
+    Quote a value as an OData string literal.
+    
+    Args:
+        value: The raw string value
+        
+    Returns:
+        The value wrapped in single quotes with embedded quotes doubled
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize types that orjson does not handle natively (enums, datetimes
+    and dataclasses are already supported).
+    
+    Args:
+        obj: The object to serialize
+        
+    Returns:
+        A JSON-serializable representation of the object
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+class _TunedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets also enable TCP keep-alive probes.
+    
+    urllib3's defaults already set TCP_NODELAY, so small JSON requests are not
+    held back by Nagle's algorithm; SO_KEEPALIVE lets idle pooled connections
+    between polls be detected as dead instead of failing on the next request.
+    """
+    
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class AgentBuilderClient:
     """
@@ -34,6 +123,22 @@ class AgentBuilderClient:
     for creating and managing agents, chats, and messages.
     """
     
+    # Endpoint templates, formatted with the entity IDs in path order
+    _AGENTS = "/api/v1/Agents"
+    _AGENT = _AGENTS + "({})"
+    _TOOLS = _AGENT + "/tools"
+    _TOOL = _TOOLS + "({})"
+    _RESOURCES = _TOOL + "/resources"
+    _RESOURCE = _RESOURCES + "({})"
+    _CHATS = _AGENT + "/chats"
+    _CHAT = _CHATS + "({})"
+    _HISTORY = _CHAT + "/history"
+    _MESSAGE = _HISTORY + "({})"
+    _CHAT_ACTION = _CHAT + "/UnifiedAiAgentService.{}"
+    
+    # Process-wide clients handed out by get_default(), keyed by their arguments
+    _default_instances: Dict[tuple, "AgentBuilderClient"] = {}
+    
     def __init__(
         self,
         auth_url: Optional[str] = None,
@@ -61,7 +166,7 @@ class AgentBuilderClient:
             dotenv_path: Optional path to .env file
         """
         # Load environment variables from .env file
-        load_dotenv(dotenv_path=dotenv_path)
+        _load_dotenv(dotenv_path)
         
         # Use provided values or fall back to environment variables
         self.api_base_url = (api_base_url or os.getenv("BAF_API_BASE_URL")).rstrip("/")
@@ -81,26 +186,85 @@ class AgentBuilderClient:
         
         self.token_manager = TokenManager(auth_url, client_id, client_secret)
         self.timeout = timeout
+        # (token, headers) pair; headers are rebuilt only when the token rotates
+        self._headers_cache: Tuple[Optional[str], Optional[Dict[str, str]]] = (None, None)
+        # URL -> (ETag, parsed body) for conditional GETs issued while polling
+        self._etag_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
+        # Reuse one session so keep-alive connections survive across calls
+        # (polling loops would otherwise pay a TCP+TLS handshake per request)
+        self._session = requests.Session()
+        adapter = _TunedHTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    @classmethod
+    def get_default(cls, **kwargs) -> "AgentBuilderClient":
+        """
+        Get a shared client instance for the given configuration.
+        
+        Repeated calls with the same keyword arguments return the same client,
+        so its OAuth token and HTTP connections are reused across callers.
+        
+        Args:
+            **kwargs: Constructor arguments for the client
+            
+        Returns:
+            The shared client instance
+        """
+        key = (cls, tuple(sorted(kwargs.items())))
+        instance = cls._default_instances.get(key)
+        if instance is None:
+            instance = cls(**kwargs)
+            cls._default_instances[key] = instance
+        return instance
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "AgentBuilderClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     def _get_headers(self) -> Dict[str, str]:
         """
         Get headers with authorization token for API requests.
         
+        The same dictionary is returned until the token changes, so callers
+        must not modify it.
+        
         Returns:
             Dictionary of HTTP headers
         """
         token = self.token_manager.get_token()
-        return {
+        cached_token, cached_headers = self._headers_cache
+        if token == cached_token:
+            return cached_headers
+        
+        headers = {
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            # Lists such as chat history compress well; br/zstd are included
+            # only when a decoder for them is installed
+            "Accept-Encoding": ACCEPT_ENCODING
         }
+        self._headers_cache = (token, headers)
+        return headers
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = False
     ) -> Dict[str, Any]:
         """
         Make an API request.
@@ -110,6 +274,8 @@ class AgentBuilderClient:
             endpoint: API endpoint (relative to base URL)
             data: Request data (for POST, PATCH)
             params: Query parameters
+            conditional: For GET requests, send If-None-Match with the last seen
+                ETag and reuse the cached body on 304 Not Modified
             
         Returns:
             Response data as a dictionary
@@ -120,62 +286,150 @@ class AgentBuilderClient:
         url = f"{self.api_base_url}{endpoint}"
         headers = self._get_headers()
         
-        logger.debug(f"Making API request: {method} {url}")
-        logger.debug(f"Headers: {headers}")
-        logger.debug(f"Params: {params}")
-        logger.debug(f"Data: {data}")
+        cached = self._etag_cache.get(url) if conditional else None
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        
+        # Payloads can be large, so only log them when DEBUG is actually enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Making API request: %s %s", method, url)
+            logger.debug("Headers: %s", headers)
+            logger.debug("Params: %s", params)
+            logger.debug("Data: %s", data)
+        
+        if method not in ("GET", "POST", "PATCH", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        body = None
+        if data is not None:
+            body = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
         
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, params=params, timeout=self.timeout)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=headers, json=data, params=params, timeout=self.timeout)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, params=params, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            logger.debug(f"API Response Status Code: {response.status_code}")
-            response.raise_for_status()
-            
-            if response.status_code == 204:  # No content
-                logger.debug("API Response: No content (204)")
-                return {}
-                
-            response_json = response.json()
-            logger.debug(f"API Response JSON: {response_json}")
-            return response_json
-            
+            response = self._session.request(
+                method,
+                url,
+                headers=headers,
+                data=body,
+                params=params,
+                timeout=self.timeout
+            )
         except requests.RequestException as e:
-            error_msg = str(e)
-            error_details = ""
-            
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"API Error Status Code: {e.response.status_code}")
-                try:
-                    error_data = e.response.json()
-                    if 'error' in error_data:
-                        error_details = f"{error_data.get('error')}: {error_data.get('message', '')}"
-                    elif isinstance(error_data, dict):
-                        # If error is not structured as expected, just dump the whole error data
-                        error_details = json.dumps(error_data)
-                    logger.error(f"API Error Response JSON: {error_data}")
-                except Exception:
-                    # If we can't parse as JSON, use text content
-                    error_details = e.response.text
-                    logger.error(f"API Error Response Text: {error_details}")
-            
-            full_error = error_msg
-            if error_details:
-                full_error = f"{error_msg} - {error_details}"
-                
-            logger.error(f"API request failed: {full_error}")
-            raise ApiError(f"API request failed: {full_error}") from e
+            logger.error(f"API request failed: {str(e)}")
+            raise ApiError(f"API request failed: {str(e)}") from e
+        
+        status_code = response.status_code
+        logger.debug("API Response Status Code: %s", status_code)
+        if cached and status_code == 304:  # Not modified since last poll
+            return cached[1]
+        
+        if status_code == 204:  # No content
+            logger.debug("API Response: No content (204)")
+            return {}
+        
+        # orjson parses the UTF-8 bytes directly; some actions answer 200/201 with no body
+        raw = response.content
+        
+        if status_code >= 400:
+            self._raise_api_error(response, raw)
+        
+        if not raw:
+            return {}
+        response_json = orjson.loads(raw)
+        if debug:
+            logger.debug("API Response JSON: %s", response_json)
+        
+        if conditional and "ETag" in response.headers:
+            self._etag_cache[url] = (response.headers["ETag"], response_json)
+        return response_json
+    
+    @staticmethod
+    def _raise_api_error(response: requests.Response, raw: bytes) -> None:
+        """
+        Raise an ApiError for an error response, parsing its body only once.
+        
+        Args:
+            response: The HTTP response with an error status code
+            raw: The raw response body
+            
+        Raises:
+            ApiError: Always, with the status code and parsed body attached
+        """
+        status_code = response.status_code
+        kind = "Client" if status_code < 500 else "Server"
+        error_msg = f"{status_code} {kind} Error: {response.reason} for url: {response.url}"
+        logger.error(f"API Error Status Code: {status_code}")
+        
+        error_data = None
+        error_details = raw.decode("utf-8", errors="replace")
+        try:
+            error_data = orjson.loads(raw) if raw else None
+        except orjson.JSONDecodeError:
+            logger.error(f"API Error Response Text: {error_details}")
+        else:
+            if isinstance(error_data, dict) and 'error' in error_data:
+                error_details = f"{error_data.get('error')}: {error_data.get('message', '')}"
+            logger.error(f"API Error Response JSON: {error_data}")
+        
+        full_error = error_msg
+        if error_details:
+            full_error = f"{error_msg} - {error_details}"
+        
+        logger.error(f"API request failed: {full_error}")
+        raise ApiError(f"API request failed: {full_error}", status_code=status_code, error_data=error_data)
+    
+    def _iter_collection(
+        self,
+        endpoint: str,
+        from_api_dict: Callable[[Dict[str, Any]], T],
+        page_size: int = 100,
+        order_by: str = "ID"
+    ) -> Iterator[T]:
+        """
+        Iterate over a collection endpoint page by page.
+        
+        Pages are requested with $top/$skip only as the caller consumes them,
+        so stopping early avoids fetching the rest of the collection. Every
+        request carries $orderby so pages don't overlap or leave gaps, and
+        even a collection that fits on one page is requested with
+        $top, $skip and $orderby.
+        
+        Args:
+            endpoint: Collection endpoint (relative to base URL)
+            from_api_dict: Factory that builds a model object from a record
+            page_size: Number of records requested per page
+            order_by: $orderby expression giving the records a stable order
+            
+        Yields:
+            Model objects built from the records
+        """
+        params = {"$top": page_size, "$skip": 0, "$orderby": order_by}
+        previous_first_id = None
+        while True:
+            response = self._make_request("GET", endpoint, params=params)
+            page = response.get("value", [])
+            # A server that ignores $skip sends the previous page again
+            if page and previous_first_id is not None and page[0].get("ID") == previous_first_id:
+                return
+            for item in page:
+                yield from_api_dict(item)
+            # A short page is the last one; a long page means the server ignored $top
+            if len(page) != page_size:
+                return
+            previous_first_id = page[0].get("ID")
+            params["$skip"] += page_size
     
     # Agent methods
     
+    def iter_agents(self) -> Iterator[Agent]:
+        """
+        Iterate over all agents, fetching them page by page.
+        
+        Returns:
+            Iterator of Agent objects
+        """
+        return self._iter_collection(self._AGENTS, Agent.from_api_dict)
+    
     def list_agents(self) -> List[Agent]:
         """
         Get a list of all agents.
@@ -183,13 +437,7 @@ class AgentBuilderClient:
         Returns:
             List of Agent objects
         """
-        response = self._make_request("GET", "/api/v1/Agents")
-        agents = []
-        
-        for agent_data in response.get("value", []):
-            agents.append(Agent.from_api_dict(agent_data))
-            
-        return agents
+        return list(self.iter_agents())
     
     def get_agent(self, agent_id: str) -> Agent:
         """
@@ -204,9 +452,27 @@ class AgentBuilderClient:
         Raises:
             ApiError: If the agent is not found
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})")
+        response = self._make_request("GET", self._AGENT.format(agent_id))
         return Agent.from_api_dict(response)
     
+    def _find_agent_by_name(self, name: str) -> Optional[Agent]:
+        """
+        Find an agent by name using a server-side filter.
+        
+        Args:
+            name: The name of the agent
+            
+        Returns:
+            Agent object if found, otherwise None
+        """
+        response = self._make_request(
+            "GET",
+            self._AGENTS,
+            params={"$filter": f"name eq {_odata_string(name)}", "$top": 1}
+        )
+        values = response.get("value", [])
+        return Agent.from_api_dict(values[0]) if values else None
+    
     def create_agent(self, agent: Agent) -> Agent:
         """
         Create a new agent or update an existing one with the same name.
@@ -218,8 +484,7 @@ class AgentBuilderClient:
             Created or updated Agent object with ID
         """
         # Check if an agent with the same name already exists
-        existing_agents = self.list_agents()
-        existing_agent = next((a for a in existing_agents if a.name == agent.name), None)
+        existing_agent = self._find_agent_by_name(agent.name)
         
         if existing_agent:
             logger.info(f"Agent with name '{agent.name}' already exists (ID: {existing_agent.id}). Updating instead.")
@@ -228,15 +493,16 @@ class AgentBuilderClient:
             # Remove ID from update data if present
             update_data.pop("ID", None)
             
-            self._make_request("PATCH", f"/api/v1/Agents({existing_agent.id})", data=update_data)
+            self._make_request("PATCH", self._AGENT.format(existing_agent.id), data=update_data)
             return self.get_agent(existing_agent.id)
         
         # Create a new agent if none exists with that name
-        response = self._make_request("POST", "/api/v1/Agents", data=agent.to_api_dict())
-        agent_id = response.get("ID")
+        response = self._make_request("POST", self._AGENTS, data=agent.to_api_dict())
         
-        # Get the full agent object
-        return self.get_agent(agent_id)
+        # The POST response usually carries the full entity; only fetch it when it does not
+        if "name" in response:
+            return Agent.from_api_dict(response)
+        return self.get_agent(response.get("ID"))
     
     def update_agent(self, agent_id: str, **kwargs) -> Agent:
         """
@@ -250,14 +516,9 @@ class AgentBuilderClient:
             Updated Agent object
         """
         # Convert snake_case keys to camelCase for API
-        data = {}
-        for key, value in kwargs.items():
-            # Convert snake_case to camelCase
-            parts = key.split('_')
-            camel_key = parts[0] + ''.join(x.title() for x in parts[1:])
-            data[camel_key] = value
-        
-        self._make_request("PATCH", f"/api/v1/Agents({agent_id})", data=data)
+        data = {_snake_to_camel(key): value for key, value in kwargs.items()}
+        
+        self._make_request("PATCH", self._AGENT.format(agent_id), data=data)
         return self.get_agent(agent_id)
     
     def delete_agent(self, agent_id: str) -> None:
@@ -267,10 +528,22 @@ class AgentBuilderClient:
         Args:
             agent_id: The ID of the agent to delete
         """
-        self._make_request("DELETE", f"/api/v1/Agents({agent_id})")
+        self._make_request("DELETE", self._AGENT.format(agent_id))
     
     # Tool methods
     
+    def iter_tools(self, agent_id: str) -> Iterator[Tool]:
+        """
+        Iterate over all tools of an agent, fetching them page by page.
+        
+        Args:
+            agent_id: The ID of the agent
+            
+        Returns:
+            Iterator of Tool objects
+        """
+        return self._iter_collection(self._TOOLS.format(agent_id), Tool.from_api_dict)
+    
     def list_tools(self, agent_id: str) -> List[Tool]:
         """
         Get a list of all tools for an agent.
@@ -281,13 +554,7 @@ class AgentBuilderClient:
         Returns:
             List of Tool objects
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/tools")
-        tools = []
-        
-        for tool_data in response.get("value", []):
-            tools.append(Tool.from_api_dict(tool_data))
-            
-        return tools
+        return list(self.iter_tools(agent_id))
     
     def get_tool(self, agent_id: str, tool_id: str) -> Tool:
         """
@@ -300,7 +567,7 @@ class AgentBuilderClient:
         Returns:
             Tool object
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/tools({tool_id})")
+        response = self._make_request("GET", self._TOOL.format(agent_id, tool_id))
         return Tool.from_api_dict(response)
     
     def create_tool(self, agent_id: str, tool: Tool) -> Tool:
@@ -316,13 +583,13 @@ class AgentBuilderClient:
         """
         response = self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/tools",
+            self._TOOLS.format(agent_id),
             data=tool.to_api_dict()
         )
-        tool_id = response.get("ID")
         
-        # Get the full tool object
-        return self.get_tool(agent_id, tool_id)
+        if "name" in response:
+            return Tool.from_api_dict(response)
+        return self.get_tool(agent_id, response.get("ID"))
     
     def wait_for_tool_ready(
         self,
@@ -338,30 +605,48 @@ class AgentBuilderClient:
             agent_id: The ID of the agent
             tool_id: The ID of the tool
             max_attempts: Maximum number of polling attempts
-            interval: Polling interval in seconds
+            interval: Maximum polling interval in seconds (polling backs off up to it)
             
         Returns:
             Tool object in ready state
             
         Raises:
             ResourceNotReadyError: If the tool fails to become ready
-            TimeoutError: If max_attempts is reached
+            SDKTimeoutError: If max_attempts is reached
         """
-        for attempt in range(max_attempts):
-            tool = self.get_tool(agent_id, tool_id)
-            
-            if tool.state == "ready":
-                return tool
-            elif tool.state == "error":
-                raise ResourceNotReadyError(f"Tool failed to become ready: {tool.last_error}")
-            
-            logger.debug(f"Tool not ready yet, waiting... (state: {tool.state})")
-            time.sleep(interval)
+        endpoint = self._TOOL.format(agent_id, tool_id)
+        try:
+            for attempt in range(max_attempts):
+                tool = Tool.from_api_dict(self._make_request("GET", endpoint, conditional=True))
+                
+                if tool.state == "ready":
+                    return tool
+                elif tool.state == "error":
+                    raise ResourceNotReadyError(f"Tool failed to become ready: {tool.last_error}")
+                
+                delay = min(interval, _POLL_BASE_DELAY * 2 ** attempt)
+                logger.debug(f"Tool not ready yet, waiting {delay}s... (state: {tool.state})")
+                time.sleep(delay)
+        finally:
+            self._etag_cache.pop(f"{self.api_base_url}{endpoint}", None)
         
-        raise TimeoutError(f"Tool did not become ready after {max_attempts} attempts")
+        raise SDKTimeoutError(f"Tool did not become ready after {max_attempts} attempts")
     
     # Resource methods
     
+    def iter_resources(self, agent_id: str, tool_id: str) -> Iterator[Resource]:
+        """
+        Iterate over all resources of a tool, fetching them page by page.
+        
+        Args:
+            agent_id: The ID of the agent
+            tool_id: The ID of the tool
+            
+        Returns:
+            Iterator of Resource objects
+        """
+        return self._iter_collection(self._RESOURCES.format(agent_id, tool_id), Resource.from_api_dict)
+    
     def list_resources(self, agent_id: str, tool_id: str) -> List[Resource]:
         """
         Get a list of all resources for a tool.
@@ -373,13 +658,7 @@ class AgentBuilderClient:
         Returns:
             List of Resource objects
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/tools({tool_id})/resources")
-        resources = []
-        
-        for resource_data in response.get("value", []):
-            resources.append(Resource.from_api_dict(resource_data))
-            
-        return resources
+        return list(self.iter_resources(agent_id, tool_id))
     
     def get_resource(self, agent_id: str, tool_id: str, resource_id: str) -> Resource:
         """
@@ -393,10 +672,7 @@ class AgentBuilderClient:
         Returns:
             Resource object
         """
-        response = self._make_request(
-            "GET",
-            f"/api/v1/Agents({agent_id})/tools({tool_id})/resources({resource_id})"
-        )
+        response = self._make_request("GET", self._RESOURCE.format(agent_id, tool_id, resource_id))
         return Resource.from_api_dict(response)
     
     def create_resource(
@@ -418,19 +694,52 @@ class AgentBuilderClient:
         Returns:
             Created Resource object with ID
         """
+        data = resource.to_api_dict()
         if file_content:
-            # Base64 encode the file content
-            resource.data = base64.b64encode(file_content).decode('utf-8')
+            # Encode straight into the request body instead of keeping another
+            # copy of the payload on the Resource object
+            data["data"] = base64.b64encode(file_content).decode("ascii")
         
         response = self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/tools({tool_id})/resources",
-            data=resource.to_api_dict()
+            self._RESOURCES.format(agent_id, tool_id),
+            data=data
         )
-        resource_id = response.get("ID")
         
-        # Get the full resource object
-        return self.get_resource(agent_id, tool_id, resource_id)
+        if "name" in response:
+            return Resource.from_api_dict(response)
+        return self.get_resource(agent_id, tool_id, response.get("ID"))
+    
+    def bulk_create_resources(
+        self,
+        agent_id: str,
+        tool_id: str,
+        items: Iterable[Tuple[Resource, Optional[bytes]]],
+        max_workers: int = 10
+    ) -> List[Resource]:
+        """
+        Create several resources for a tool concurrently.
+        
+        Uploads run in a thread pool over the client's shared connection pool.
+        
+        Args:
+            agent_id: The ID of the agent
+            tool_id: The ID of the tool
+            items: Pairs of Resource object and optional binary content to upload
+            max_workers: Maximum number of concurrent uploads
+            
+        Returns:
+            Created Resource objects, in the same order as items
+            
+        Raises:
+            ApiError: If any of the uploads fails
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.create_resource, agent_id, tool_id, resource, file_content)
+                for resource, file_content in items
+            ]
+            return [future.result() for future in futures]
     
     def wait_for_resource_ready(
         self,
@@ -448,30 +757,47 @@ class AgentBuilderClient:
             tool_id: The ID of the tool
             resource_id: The ID of the resource
             max_attempts: Maximum number of polling attempts
-            interval: Polling interval in seconds
+            interval: Maximum polling interval in seconds (polling backs off up to it)
             
         Returns:
             Resource object in ready state
             
         Raises:
             ResourceNotReadyError: If the resource fails to become ready
-            TimeoutError: If max_attempts is reached
+            SDKTimeoutError: If max_attempts is reached
         """
-        for attempt in range(max_attempts):
-            resource = self.get_resource(agent_id, tool_id, resource_id)
-            
-            if resource.state == ResourceState.READY:
-                return resource
-            elif resource.state == ResourceState.ERROR:
-                raise ResourceNotReadyError(f"Resource failed to become ready: {resource.last_error}")
-            
-            logger.debug(f"Resource not ready yet, waiting... (state: {resource.state})")
-            time.sleep(interval)
+        endpoint = self._RESOURCE.format(agent_id, tool_id, resource_id)
+        try:
+            for attempt in range(max_attempts):
+                resource = Resource.from_api_dict(self._make_request("GET", endpoint, conditional=True))
+                
+                if resource.state == ResourceState.READY:
+                    return resource
+                elif resource.state == ResourceState.ERROR:
+                    raise ResourceNotReadyError(f"Resource failed to become ready: {resource.last_error}")
+                
+                delay = min(interval, _POLL_BASE_DELAY * 2 ** attempt)
+                logger.debug(f"Resource not ready yet, waiting {delay}s... (state: {resource.state})")
+                time.sleep(delay)
+        finally:
+            self._etag_cache.pop(f"{self.api_base_url}{endpoint}", None)
         
-        raise TimeoutError(f"Resource did not become ready after {max_attempts} attempts")
+        raise SDKTimeoutError(f"Resource did not become ready after {max_attempts} attempts")
     
     # Chat methods
     
+    def iter_chats(self, agent_id: str) -> Iterator[Chat]:
+        """
+        Iterate over all chats of an agent, fetching them page by page.
+        
+        Args:
+            agent_id: The ID of the agent
+            
+        Returns:
+            Iterator of Chat objects
+        """
+        return self._iter_collection(self._CHATS.format(agent_id), Chat.from_api_dict)
+    
     def list_chats(self, agent_id: str) -> List[Chat]:
         """
         Get a list of all chats for an agent.
@@ -482,13 +808,7 @@ class AgentBuilderClient:
         Returns:
             List of Chat objects
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/chats")
-        chats = []
-        
-        for chat_data in response.get("value", []):
-            chats.append(Chat.from_api_dict(chat_data))
-            
-        return chats
+        return list(self.iter_chats(agent_id))
     
     def get_chat(self, agent_id: str, chat_id: str) -> Chat:
         """
@@ -501,9 +821,28 @@ class AgentBuilderClient:
         Returns:
             Chat object
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/chats({chat_id})")
+        response = self._make_request("GET", self._CHAT.format(agent_id, chat_id))
         return Chat.from_api_dict(response)
     
+    def _find_chat_by_name(self, agent_id: str, name: str) -> Optional[Chat]:
+        """
+        Find a chat of an agent by name using a server-side filter.
+        
+        Args:
+            agent_id: The ID of the agent
+            name: The name of the chat
+            
+        Returns:
+            Chat object if found, otherwise None
+        """
+        response = self._make_request(
+            "GET",
+            self._CHATS.format(agent_id),
+            params={"$filter": f"name eq {_odata_string(name)}", "$top": 1}
+        )
+        values = response.get("value", [])
+        return Chat.from_api_dict(values[0]) if values else None
+    
     def create_chat(self, agent_id: str, chat: Chat) -> Chat:
         """
         Create a new chat for an agent or return an existing one with the same name.
@@ -516,8 +855,7 @@ class AgentBuilderClient:
             Created Chat object with ID or existing chat with the same name
         """
         # Check if a chat with the same name already exists for this agent
-        existing_chats = self.list_chats(agent_id)
-        existing_chat = next((c for c in existing_chats if c.name == chat.name), None)
+        existing_chat = self._find_chat_by_name(agent_id, chat.name)
         
         if existing_chat:
             logger.info(f"Chat with name '{chat.name}' already exists for agent {agent_id} (Chat ID: {existing_chat.id}). Returning existing chat.")
@@ -526,16 +864,34 @@ class AgentBuilderClient:
         # Create a new chat if none exists with that name
         response = self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/chats",
+            self._CHATS.format(agent_id),
             data=chat.to_api_dict()
         )
-        chat_id = response.get("ID")
         
-        # Get the full chat object
-        return self.get_chat(agent_id, chat_id)
+        if "name" in response:
+            return Chat.from_api_dict(response)
+        return self.get_chat(agent_id, response.get("ID"))
     
     # Message methods
     
+    def iter_messages(self, agent_id: str, chat_id: str) -> Iterator[Message]:
+        """
+        Iterate over all messages in a chat, fetching them page by page.
+        
+        Args:
+            agent_id: The ID of the agent
+            chat_id: The ID of the chat
+            
+        Returns:
+            Iterator of Message objects
+        """
+        return self._iter_collection(
+            self._HISTORY.format(agent_id, chat_id),
+            Message.from_api_dict,
+            # Keep the messages in the order they were written
+            order_by="createdAt,ID"
+        )
+    
     def list_messages(self, agent_id: str, chat_id: str) -> List[Message]:
         """
         Get a list of all messages in a chat.
@@ -547,13 +903,7 @@ class AgentBuilderClient:
         Returns:
             List of Message objects
         """
-        response = self._make_request("GET", f"/api/v1/Agents({agent_id})/chats({chat_id})/history")
-        messages = []
-        
-        for message_data in response.get("value", []):
-            messages.append(Message.from_api_dict(message_data))
-            
-        return messages
+        return list(self.iter_messages(agent_id, chat_id))
     
     def get_message(self, agent_id: str, chat_id: str, message_id: str) -> Message:
         """
@@ -567,10 +917,7 @@ class AgentBuilderClient:
         Returns:
             Message object
         """
-        response = self._make_request(
-            "GET",
-            f"/api/v1/Agents({agent_id})/chats({chat_id})/history({message_id})"
-        )
+        response = self._make_request("GET", self._MESSAGE.format(agent_id, chat_id, message_id))
         return Message.from_api_dict(response)
     
     def send_message(
@@ -601,8 +948,10 @@ class AgentBuilderClient:
             If async_mode is True, returns the history ID
             If async_mode is False, returns the agent's response
         """
-        logger.info(f"Sending message to agent {agent_id}, chat {chat_id}, async={async_mode}")
-        logger.debug(f"Message content: {message}")
+        logger.info("Sending message to agent %s, chat %s, async=%s", agent_id, chat_id, async_mode)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Message content: %s", message)
         data = {
             "msg": message,
             "outputFormat": output_format.value,
@@ -612,28 +961,31 @@ class AgentBuilderClient:
         
         if output_format_options:
             data["outputFormatOptions"] = output_format_options
-            logger.debug(f"Output format options: {output_format_options}")
+            logger.debug("Output format options: %s", output_format_options)
             
         if destination:
             data["destination"] = destination
-            logger.debug(f"Destination: {destination}")
+            logger.debug("Destination: %s", destination)
         
-        logger.debug(f"Calling send_message endpoint with data: {data}")
+        if debug:
+            logger.debug("Calling send_message endpoint with data: %s", data)
         response = self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/chats({chat_id})/UnifiedAiAgentService.sendMessage",
+            self._CHAT_ACTION.format(agent_id, chat_id, "sendMessage"),
             data=data
         )
-        logger.debug(f"Send message response: {response}")
+        if debug:
+            logger.debug("Send message response: %s", response)
         
         if async_mode:
             result = response.get("historyId")
-            logger.info(f"Message sent asynchronously. History ID: {result}")
+            logger.info("Message sent asynchronously. History ID: %s", result)
             return result
         else:
             result = response.get("answer", "")
-            logger.info(f"Message sent synchronously. Received answer.")
-            logger.debug(f"Answer content: {result}")
+            logger.info("Message sent synchronously. Received answer.")
+            if debug:
+                logger.debug("Answer content: %s", result)
             return result
     
     def wait_for_message_response(
@@ -652,37 +1004,41 @@ class AgentBuilderClient:
             chat_id: The ID of the chat
             history_id: The history ID of the sent message
             max_attempts: Maximum number of polling attempts
-            interval: Polling interval in seconds
+            interval: Maximum polling interval in seconds (polling backs off up to it)
             
         Returns:
             Message object containing the agent's response
             
         Raises:
             ApiError: If the chat fails
-            TimeoutError: If max_attempts is reached
+            SDKTimeoutError: If max_attempts is reached
         """
         for attempt in range(max_attempts):
-            logger.debug(f"Polling for response to history ID {history_id} (Attempt {attempt+1}/{max_attempts})")
-            # Get all messages in the chat
-            all_messages = self.list_messages(agent_id, chat_id)
-
-            # Find the message that is a response to our sent message
-            for message in all_messages:
-                if message.previous_id == history_id:
-                    logger.info(f"Found response message {message.id} for history ID {history_id}")
-                    return message
+            logger.debug("Polling for response to history ID %s (Attempt %d/%d)", history_id, attempt + 1, max_attempts)
+            # Ask only for the message that answers ours instead of the whole history
+            response = self._make_request(
+                "GET",
+                self._HISTORY.format(agent_id, chat_id),
+                params={"$filter": f"previous/ID eq {history_id}", "$top": 1}
+            )
+            answers = response.get("value", [])
+            if answers:
+                message = Message.from_api_dict(answers[0])
+                logger.info("Found response message %s for history ID %s", message.id, history_id)
+                return message
 
             # Check if the chat is in a failed state (optional but good practice)
-            chat = self.get_chat(agent_id, chat_id)
-            if chat.state == ChatState.FAILED:
+            chat_data = self._make_request("GET", self._CHAT.format(agent_id, chat_id), params={"$select": "state"})
+            if Chat.from_api_dict(chat_data).state == ChatState.FAILED:
                 logger.error(f"Chat {chat_id} entered FAILED state while waiting for response.")
                 raise ApiError("Chat processing failed")
 
-            logger.debug(f"No response yet for {history_id}, waiting {interval}s...")
-            time.sleep(interval)
+            delay = min(interval, _POLL_BASE_DELAY * 2 ** attempt)
+            logger.debug("No response yet for %s, waiting %ss...", history_id, delay)
+            time.sleep(delay)
 
         logger.error(f"No response received for history ID {history_id} after {max_attempts} attempts")
-        raise TimeoutError(f"No response received after {max_attempts} attempts")
+        raise SDKTimeoutError(f"No response received after {max_attempts} attempts")
     
     def continue_message(
         self,
@@ -722,7 +1078,7 @@ class AgentBuilderClient:
         
         response = self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/chats({chat_id})/UnifiedAiAgentService.continueMessage",
+            self._CHAT_ACTION.format(agent_id, chat_id, "continueMessage"),
             data=data
         )
         
@@ -741,6 +1097,6 @@ class AgentBuilderClient:
         """
         self._make_request(
             "POST",
-            f"/api/v1/Agents({agent_id})/chats({chat_id})/UnifiedAiAgentService.cancel",
+            self._CHAT_ACTION.format(agent_id, chat_id, "cancel"),
             data={}
         ) 
\ No newline at end of file
@@ -4,10 +4,22 @@ Exception classes for the PAB SDK.
 This module contains custom exception classes used throughout the SDK.
 """
 
+from typing import Any, Optional
+
 
 class ApiError(Exception):
-    """Exception raised for errors in API responses."""
-    pass
+    """
+    Exception raised for errors in API responses.
+    
+    Attributes:
+        status_code: HTTP status code of the failed response, if any
+        error_data: Parsed JSON body of the failed response, if any
+    """
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, error_data: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_data = error_data
 
 
 class AuthenticationError(Exception):
@@ -20,6 +32,15 @@ class ResourceNotReadyError(Exception):
     pass
 
 
-class TimeoutError(Exception):
-    """Exception raised when an operation times out."""
-    pass 
\ No newline at end of file
+class SDKTimeoutError(TimeoutError):
+    """
+    Exception raised when an operation times out.
+    
+    Subclasses the builtin TimeoutError, so ``except TimeoutError`` handles
+    SDK timeouts together with socket (and, on Python 3.11+, asyncio) timeouts.
+    """
+    pass
+
+
+# Backwards-compatible name; existing imports of pab_sdk.TimeoutError keep working
+TimeoutError = SDKTimeoutError
@@ -13,8 +13,13 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.0",
-        "python-dotenv>=0.19.0"
+        "python-dotenv>=0.19.0",
+        "orjson>=3.6.0"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "speedups": ["pybase64>=1.2.0", "brotli>=1.0.9"]
+    },
     python_requires=">=3.7",
     classifiers=[
         "Development Status :: 4 - Beta",
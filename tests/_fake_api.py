@@ -0,0 +1,124 @@
+"""
+In-memory stand-in for the Project Agent Builder API, served through httpx.MockTransport
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import orjson
+
+from pab_client import PABClient
+
+
+ENTITY = re.compile(r"/(\w+)\((\w+)\)")
+
+
+class FakeAPI:
+    """Agents with tools, documents and chats, answering every message at once
+
+    A message reading "fail" is rejected with a 500, as is the next message
+    after fail_next_send is set. send_delay holds every sendMessage request
+    for that many seconds.
+    """
+
+    def __init__(self):
+        self.agents: Dict[str, Dict[str, Any]] = {}
+        self.tools: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.resources: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.chats: Dict[str, str] = {}
+        self.deleted_chats: List[str] = []
+        # (chat ID, message) for every message the server accepted
+        self.sent: List[Tuple[str, str]] = []
+        self.requests: List[Tuple[str, str]] = []
+        self.fail_next_send = False
+        self.send_delay = 0.0
+        self._answers: Dict[str, str] = {}
+        self._ids = 0
+
+    def _new_id(self, prefix: str) -> str:
+        self._ids += 1
+        return f"{prefix}{self._ids}"
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        # Yield like a real round trip would, so concurrent callers interleave
+        await asyncio.sleep(0)
+        path = request.url.path
+        self.requests.append((request.method, path))
+        ids = dict(ENTITY.findall(path))
+        agent_id, tool_id, chat_id = ids.get("Agents"), ids.get("tools"), ids.get("chats")
+        body = orjson.loads(request.content) if request.content else None
+
+        if path == "/api/v1/Agents":
+            if request.method == "POST":
+                agent_id = self._new_id("A")
+                self.agents[agent_id] = {**body, "ID": agent_id, "state": "ready"}
+                self.tools[agent_id] = {}
+                return httpx.Response(201, json=self.agents[agent_id])
+            return httpx.Response(200, json={"value": list(self.agents.values())})
+        if agent_id not in self.agents:
+            return httpx.Response(404, json={})
+        if path == f"/api/v1/Agents({agent_id})":
+            return httpx.Response(200, json=self.agents[agent_id])
+
+        if path.endswith("/UnifiedAiAgentService.sendMessage"):
+            await asyncio.sleep(self.send_delay)
+            if self.fail_next_send or body["msg"] == "fail":
+                self.fail_next_send = False
+                return httpx.Response(500, json={})
+            history_id = self._new_id("H")
+            self.sent.append((chat_id, body["msg"]))
+            self._answers[history_id] = f"answer to {body['msg']}"
+            return httpx.Response(200, json={"historyId": history_id})
+        if path.endswith("/history"):
+            history_id = request.url.params["$filter"].rsplit(" ", 1)[-1]
+            return httpx.Response(200, json={"value": [{"content": self._answers[history_id]}]})
+        if path.endswith("/chats") and request.method == "POST":
+            chat_id = self._new_id("C")
+            self.chats[chat_id] = agent_id
+            return httpx.Response(201, json={"ID": chat_id})
+        if chat_id:
+            if self.chats.get(chat_id) != agent_id:
+                return httpx.Response(404, json={})
+            if request.method == "DELETE":
+                del self.chats[chat_id]
+                self.deleted_chats.append(chat_id)
+                return httpx.Response(204)
+            return httpx.Response(200, json={"ID": chat_id, "state": "active"})
+
+        tools = self.tools[agent_id]
+        if path.endswith("/tools"):
+            if request.method == "POST":
+                tool_id = self._new_id("T")
+                tools[tool_id] = {**body, "ID": tool_id, "state": "ready"}
+                self.resources[tool_id] = {}
+                return httpx.Response(201, json=tools[tool_id])
+            return httpx.Response(200, json={"value": list(tools.values())})
+        if tool_id not in tools:
+            return httpx.Response(404, json={})
+        resources = self.resources[tool_id]
+        if path.endswith("/resources"):
+            if request.method == "POST":
+                resource_id = self._new_id("R")
+                resources[resource_id] = {**body, "ID": resource_id, "state": "ready"}
+                return httpx.Response(201, json=resources[resource_id])
+            return httpx.Response(200, json={"value": list(resources.values())})
+        resource_id = ids.get("resources")
+        if resource_id:
+            if resource_id not in resources:
+                return httpx.Response(404, json={})
+            if request.method == "DELETE":
+                del resources[resource_id]
+                return httpx.Response(204)
+            return httpx.Response(200, json=resources[resource_id])
+        return httpx.Response(200, json=tools[tool_id])
+
+
+@asynccontextmanager
+async def fake_pab_client(api: FakeAPI, name: str = "Fake Client"):
+    """Yield a PABClient that talks to api; use with the offline_credentials fixture"""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as http:
+        async with PABClient(name=name, http_client=http) as client:
+            yield client
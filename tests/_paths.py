@@ -0,0 +1,14 @@
+"""
+Where the tests find the PAB credentials
+"""
+
+from pathlib import Path
+from typing import Optional
+
+# Credentials file in the repository root
+CREDENTIALS_PATH = Path(__file__).parent.parent / "agent-binding.json"
+
+
+def credentials_path() -> Optional[str]:
+    """The credentials file if present, else None so PABClient reads the PAB_* variables"""
+    return str(CREDENTIALS_PATH) if CREDENTIALS_PATH.is_file() else None
@@ -0,0 +1,85 @@
+"""
+Shared pytest configuration for the BAF Agent tests.
+
+The async tests run under pytest-asyncio (``pip install -r requirements-test.txt``),
+on uvloop when it is installed. With pytest-xdist, ``pytest -n auto`` runs
+the modules in parallel; each worker process gets its own client.
+Tests that use the pab_client fixture call the live Project Agent Builder
+API and are skipped when no credentials are available.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+import pytest_asyncio
+
+try:
+    # libuv-based event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import pab_client as pab_client_module
+from pab_client import PABClient
+from tests._paths import CREDENTIALS_PATH, credentials_path
+
+# Environment variables PABClient falls back to when there is no credentials file
+CREDENTIALS_ENV_VARS = ("PAB_CLIENT_ID", "PAB_CLIENT_SECRET", "PAB_AUTH_URL", "PAB_API_BASE_URL")
+
+
+def _have_credentials() -> bool:
+    """Check whether PAB credentials are available without prompting for them"""
+    return CREDENTIALS_PATH.is_file() or all(os.environ.get(var) for var in CREDENTIALS_ENV_VARS)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the live API tests up front instead of letting them time out"""
+    if _have_credentials():
+        return
+    skip = pytest.mark.skip(reason=f"No PAB credentials: {CREDENTIALS_PATH} not found and PAB_* variables not set")
+    for item in items:
+        if "pab_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop when it is installed
+    
+    pytest.ini sets the loop scope to the session, so every test and the
+    pab_client fixture share one loop and its HTTP connection pool.
+    """
+    if uvloop:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def pab_client():
+    """One authenticated PABClient shared by every test in the session"""
+    client = PABClient(credentials_path(), "PAB Test Client")
+    await client.warmup()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def offline_credentials(tmp_path, monkeypatch):
+    """Credentials for offline tests: PAB_* variables, a private cache file and a fake token
+    
+    The token is "token-<client id>", so tests can tell which credentials a request used.
+    """
+    monkeypatch.setattr(pab_client_module, "DEFAULT_CACHE_FILE", str(tmp_path / "pab_sdk_cache"))
+    monkeypatch.setattr(PABClient, "_cached_credentials_path", None)
+    monkeypatch.setattr(PABClient, "_token_cache", {})
+    for var, value in (("PAB_CLIENT_ID", "client"), ("PAB_CLIENT_SECRET", "secret"),
+                       ("PAB_AUTH_URL", "https://auth.example"),
+                       ("PAB_API_BASE_URL", "https://api.example")):
+        monkeypatch.setenv(var, value)
+    
+    async def refresh_token(self):
+        self._token = f"token-{self._client_id}"
+        self._token_expiry = time.time() + 3600
+    
+    monkeypatch.setattr(PABClient, "_refresh_token", refresh_token)
@@ -4,68 +4,38 @@ Test creating and using BAF agents with minimal configuration
 """
 
 import asyncio
-import json
-import os
-import sys
-import pathlib
-import pytest
-from pathlib import Path
 
-# Add parent directory to path so we can use relative imports
-parent_dir = str(pathlib.Path(__file__).parent.parent)
-sys.path.insert(0, parent_dir)
+from pab_client import PABClient, ModelType
+from tests._paths import credentials_path
 
-from pab_client import PABClient, ModelType, AgentType, OutputFormat
-
-async def test_create_and_use_agent():
+async def test_create_and_use_agent(pab_client):
     """Test creating a simple agent and using it with different output formats"""
-    try:
-        print("Creating BAF Agent wrapper...")
-        # Use .. to reference parent directory
-        credentials_path = os.path.join("..", "agent-binding.json")
-        baf = PABClient(credentials_path, "Minimal Test Agent")
-        
-        print("Authenticating...")
-        await baf._get_token()
-        
-        print("Creating agent...")
-        agent = await baf.create_agent(
-            initial_instructions="You are a helpful assistant.",
-            expert_in="Answering questions concisely",
-            # Using strings directly instead of enums
-            agent_type="smart",
-            base_model=ModelType.OPENAI_GPT4O_MINI,
-            advanced_model=ModelType.OPENAI_GPT4O
-        )
-        
-        print("Agent created successfully!")
-        
-        # Test with default markdown output
-        print("\nTesting with markdown output...")
-        md_response = await agent("What is Python? Keep it brief.")
-        print(f"Markdown response: {md_response}")
-        
-        # Test with text output
-        print("\nTesting with text output...")
-        text_response = await agent("What is Python? Keep it brief.", 
-                                   output_format="Text")
-        print(f"Text response: {text_response}")
-        
-        # Test with JSON output
-        print("\nTesting with JSON output...")
-        json_response = await agent("Name 3 programming languages.", 
-                                  output_format="JSON")
-        print(f"JSON response: {json_response}")
-        
-        print("\nAll tests completed successfully!")
-        return True
-        
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        if hasattr(e, 'response'):
-            print(f"Status code: {e.response.status_code}")
-            print(f"Response body: {e.response.text}")
-        return False
+    print("Creating agent...")
+    agent = await pab_client.create_agent(
+        name="Minimal Test Agent",
+        initial_instructions="You are a helpful assistant.",
+        expert_in="Answering questions concisely",
+        # Using strings directly instead of enums
+        agent_type="smart",
+        base_model=ModelType.OPENAI_GPT4O_MINI,
+        advanced_model=ModelType.OPENAI_GPT4O
+    )
+    
+    print("Agent created successfully!")
+    
+    # The probes are independent, so run them concurrently, each in its own chat
+    print("\nTesting markdown, text and JSON output...")
+    text_agent, json_agent = await asyncio.gather(pab_client.get_interface(), pab_client.get_interface())
+    md_response, text_response, json_response = await asyncio.gather(
+        agent("What is Python? Keep it brief."),
+        text_agent("What is Python? Keep it brief.", output_format="Text"),
+        json_agent("Name 3 programming languages.", output_format="JSON")
+    )
+    print(f"Markdown response: {md_response}")
+    print(f"Text response: {text_response}")
+    print(f"JSON response: {json_response}")
+    
+    print("\nAll tests completed successfully!")
 
 if __name__ == "__main__":
-    asyncio.run(test_create_and_use_agent()) 
\ No newline at end of file
+    asyncio.run(test_create_and_use_agent(PABClient(credentials_path(), "Minimal Test Agent")))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that an AgentInterface keeps using its own agent after the client creates another one
+"""
+
+import asyncio
+
+from pab_client import ToolType
+from tests._fake_api import FakeAPI, fake_pab_client
+
+
+def test_interface_keeps_its_agent_after_another_is_created(offline_credentials):
+    api = FakeAPI()
+
+    async def main():
+        async with fake_pab_client(api) as client:
+            first = await client.create_agent(
+                initial_instructions="First agent.",
+                initial_tools=[{"name": "calculator", "tool_type": ToolType.CALCULATOR}]
+            )
+            await first.add_document("notes.txt", "First agent's notes")
+            second = await client.create_agent(initial_instructions="Second agent.")
+
+            assert first.agent_id != second.agent_id
+            assert sorted(await first.get_tool_names()) == ["calculator", "document"]
+            assert await second.get_tool_names() == []
+            assert [doc["name"] for doc in await first.list_documents()] == ["notes.txt"]
+            assert await first.get_document_content("notes.txt") == "First agent's notes"
+            assert await second.list_documents() == []
+
+            await first("Which agent is this?")
+            await first.add_document("more.txt", "More notes")
+            assert await first.remove_document("notes.txt")
+            return first.agent_id
+
+    first_agent_id = asyncio.run(main())
+    chat_id, _ = api.sent[0]
+    assert api.chats[chat_id] == first_agent_id
+    document_tool = next(tool for tool in api.tools[first_agent_id].values() if tool["name"] == "document")
+    assert [doc["name"] for doc in api.resources[document_tool["ID"]].values()] == ["more.txt"]
+
+
+def test_interfaces_of_one_agent_create_one_document_tool(offline_credentials):
+    api = FakeAPI()
+
+    async def main():
+        async with fake_pab_client(api) as client:
+            agent = await client.create_agent(initial_instructions="Keep notes.")
+            other = await client.get_interface()
+            await asyncio.gather(
+                agent.add_document("a.txt", "A"),
+                other.add_document("b.txt", "B"),
+                agent.add_document("c.txt", "C"),
+            )
+            return agent.agent_id
+
+    agent_id = asyncio.run(main())
+    document_tools = [tool for tool in api.tools[agent_id].values() if tool["name"] == "document"]
+    assert len(document_tools) == 1
+    assert len(api.resources[document_tools[0]["ID"]]) == 3
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test AsyncAgentBuilderClient against a local aiohttp stand-in for the API
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import test_utils, web
+
+from pab_sdk import Agent, AsyncAgentBuilderClient, ApiError
+
+
+class FakeAPI:
+    """Token endpoint plus an agents collection, served over real HTTP"""
+
+    def __init__(self):
+        self.token_requests = 0
+        self.authorizations = []
+        self.agents = {"A1": {"ID": "A1", "name": "Async Agent", "type": "smart"}}
+        self.created = []
+
+    async def handler(self, request: web.Request) -> web.Response:
+        if request.method == "POST" and request.path == "/oauth/token":
+            self.token_requests += 1
+            return web.json_response({"access_token": "token", "expires_in": 3600})
+        self.authorizations.append(request.headers.get("Authorization"))
+        match = re.fullmatch(r"/api/v1/Agents(?:\((\w+)\))?", request.path)
+        agent_id = match and match.group(1)
+        if match and not agent_id:
+            if request.method == "GET":
+                name = re.fullmatch(r"name eq '(.*)'", request.query["$filter"]).group(1)
+                return web.json_response({"value": [a for a in self.agents.values() if a["name"] == name]})
+            if request.method == "POST":
+                agent = {**await request.json(), "ID": f"A{len(self.agents) + 1}"}
+                self.agents[agent["ID"]] = agent
+                self.created.append(agent["name"])
+                return web.json_response(agent, status=201)
+        if agent_id in self.agents:
+            if request.method == "GET":
+                return web.json_response(self.agents[agent_id])
+            if request.method == "PATCH":
+                self.agents[agent_id].update(await request.json())
+                return web.Response(status=204)
+        return web.json_response({"error": "NotFound", "message": "No such entity"}, status=404)
+
+
+@pytest.fixture
+async def api():
+    """Serve a FakeAPI on localhost and yield it with a client pointed at it"""
+    fake = FakeAPI()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", fake.handler)
+    server = test_utils.TestServer(app)
+    await server.start_server()
+    base_url = str(server.make_url("")).rstrip("/")
+    client = AsyncAgentBuilderClient(
+        auth_url=f"{base_url}/oauth/token",
+        api_base_url=base_url,
+        client_id="client",
+        client_secret="secret"
+    )
+    yield fake, client
+    await client.aclose()
+    await server.close()
+
+
+async def test_get_agent_async(api):
+    fake, client = api
+    agent = await client.get_agent_async("A1")
+    assert (agent.id, agent.name) == ("A1", "Async Agent")
+    assert fake.authorizations == ["Bearer token"]
+    assert fake.token_requests == 1
+
+
+async def test_error_status_raises_api_error(api):
+    _, client = api
+    with pytest.raises(ApiError) as excinfo:
+        await client.get_agent_async("missing")
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.error_data["error"] == "NotFound"
+
+
+async def test_create_agents_async_creates_each_name_once(api):
+    fake, client = api
+    agents = await client.create_agents_async([
+        Agent(name="Twin", initial_instructions="first"),
+        Agent(name="Other"),
+        Agent(name="Twin", initial_instructions="second"),
+    ])
+    assert sorted(fake.created) == ["Other", "Twin"]
+    assert agents[0].id == agents[2].id != agents[1].id
+    # The later spec for a name updates the agent the earlier one created
+    assert agents[2].initial_instructions == "second"
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test AgentInterface.batch: answer order, failures, and cleanup of the extra chats
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests._fake_api import FakeAPI, fake_pab_client
+
+
+def _batch(api: FakeAPI, messages, **kwargs):
+    async def main():
+        async with fake_pab_client(api) as client:
+            agent = await client.create_agent(initial_instructions="Answer briefly.")
+            return await agent.batch(messages, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_answers_come_back_in_message_order(offline_credentials):
+    api = FakeAPI()
+    messages = [f"question {i}" for i in range(5)]
+    assert _batch(api, messages, concurrency=3) == [f"answer to {message}" for message in messages]
+    assert len({chat for chat, _ in api.sent}) == 3
+    # The two extra chats are gone; the agent's own chat stays
+    assert len(api.deleted_chats) == 2 and len(api.chats) == 1
+
+
+def test_return_exceptions_keeps_the_other_answers(offline_credentials):
+    api = FakeAPI()
+    responses = _batch(api, ["first", "fail", "last"], concurrency=2, return_exceptions=True)
+    assert responses[0] == "answer to first"
+    assert isinstance(responses[1], httpx.HTTPStatusError)
+    assert responses[2] == "answer to last"
+    assert len(api.deleted_chats) == 1
+
+
+def test_failure_is_raised_without_return_exceptions(offline_credentials):
+    api = FakeAPI()
+    with pytest.raises(httpx.HTTPStatusError):
+        _batch(api, ["first", "fail", "last"], concurrency=2)
+    assert len(api.deleted_chats) == 1
+
+
+def test_cancelled_batch_deletes_its_extra_chats(offline_credentials):
+    api = FakeAPI()
+    api.send_delay = 60
+
+    async def main():
+        async with fake_pab_client(api) as client:
+            agent = await client.create_agent(initial_instructions="Answer briefly.")
+            batch = asyncio.ensure_future(agent.batch([f"question {i}" for i in range(4)], concurrency=3))
+            while len(api.chats) < 3:
+                await asyncio.sleep(0)
+            batch.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+            return agent.chat_id
+
+    chat_id = asyncio.run(main())
+    assert len(api.deleted_chats) == 2
+    assert list(api.chats) == [chat_id]
+    assert api.sent == []
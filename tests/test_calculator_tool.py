@@ -1,13 +1,9 @@
 import asyncio
-import json
 from pab_client import PABClient, ToolType, ModelType, AgentType, OutputFormat
 
-async def test_calculator_tool():
+async def test_calculator_tool(pab_client):
     """Test the PAB calculator tool"""
-    # Initialize the PAB client
-    # Get path to the credentials file
-    credentials_path = "agent-binding.json"
-    client = PABClient(credentials_path)
+    client = pab_client
     
     # Create an agent with custom name
     agent = await client.create_agent(
@@ -26,31 +22,24 @@ async def test_calculator_tool():
     )
     print(f"Added calculator tool with ID: {calculator_tool_id}")
     
-    # Test with a simple calculation
-    question = "What is the square root of 144 plus 50 divided by 2?"
-    print(f"\nAsking: {question}")
-    
-    response = await agent.send_message(
-        question,
-        output_format=OutputFormat.MARKDOWN
-    )
-    print(f"\nResponse: {response}")
-    
-    # Test with a more complex calculation
-    question = "If I invest $1000 with 5% annual compound interest, how much will I have after 10 years?"
-    print(f"\nAsking: {question}")
-    
-    response = await agent.send_message(
-        question,
-        output_format=OutputFormat.MARKDOWN
+    # The two calculations are independent, so ask them as one batch;
+    # listing the tools doesn't depend on the answers either
+    questions = [
+        "What is the square root of 144 plus 50 divided by 2?",
+        "If I invest $1000 with 5% annual compound interest, how much will I have after 10 years?"
+    ]
+    responses, tools = await asyncio.gather(
+        agent.batch(questions, output_format=OutputFormat.MARKDOWN),
+        agent.list_tools()
     )
-    print(f"\nResponse: {response}")
+    for question, response in zip(questions, responses):
+        print(f"\nAsking: {question}")
+        print(f"\nResponse: {response}")
     
     # List available tools
-    tools = await agent.list_tools()
-    print("\nAvailable tools:")
-    for tool in tools:
-        print(f"- {tool.get('name')} ({tool.get('type')}): {tool.get('state')}")
+    print("\nAvailable tools:\n" + "\n".join(
+        f"- {tool.get('name')} ({tool.get('type')}): {tool.get('state')}" for tool in tools
+    ))
 
 if __name__ == "__main__":
-    asyncio.run(test_calculator_tool()) 
\ No newline at end of file
+    asyncio.run(test_calculator_tool(PABClient("agent-binding.json"))) 
\ No newline at end of file
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test how PABClient uses an http_client shared with other PABClients
+"""
+
+import asyncio
+
+import httpx
+
+from pab_client import PABClient
+
+
+def test_shared_http_client_keeps_its_settings(offline_credentials):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.host, request.headers["Authorization"], request.headers.get("X-App")))
+        return httpx.Response(200, json={"value": []})
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler),
+                                     headers={"X-App": "mine"}) as http:
+            first = PABClient(name="First", http_client=http)
+            second = PABClient(name="Second", http_client=http)
+            second.configure(client_id="other", api_url="https://other.example")
+            await first.warmup()
+            await second.warmup()
+            await first.warmup()
+            assert str(http.base_url) == ""
+            assert "Authorization" not in http.headers
+
+    asyncio.run(main())
+    assert seen == [
+        ("api.example", "Bearer token-client", "mine"),
+        ("other.example", "Bearer token-other", "mine"),
+        ("api.example", "Bearer token-client", "mine"),
+    ]
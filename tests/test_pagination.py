@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test the sync SDK's page-by-page iteration over collections
+"""
+
+import pytest
+
+from pab_sdk import AgentBuilderClient
+
+
+class FakeCollection:
+    """Collection endpoint that pages by $top/$skip, or ignores $skip if told to"""
+
+    def __init__(self, size: int, honour_skip: bool = True):
+        self.records = [{"ID": f"A{i:03}", "name": f"Agent {i}"} for i in range(size)]
+        self.honour_skip = honour_skip
+        self.requests = []
+
+    def __call__(self, method, endpoint, data=None, params=None, conditional=False):
+        self.requests.append(dict(params))
+        skip = params["$skip"] if self.honour_skip else 0
+        return {"value": self.records[skip:skip + params["$top"]]}
+
+
+@pytest.fixture
+def client():
+    with AgentBuilderClient(
+        auth_url="https://auth.example/oauth/token",
+        api_base_url="https://api.example",
+        client_id="client",
+        client_secret="secret"
+    ) as client:
+        yield client
+
+
+def test_pages_until_a_short_page(client, monkeypatch):
+    collection = FakeCollection(250)
+    monkeypatch.setattr(client, "_make_request", collection)
+
+    agents = client.list_agents()
+
+    assert [agent.id for agent in agents] == [record["ID"] for record in collection.records]
+    assert [request["$skip"] for request in collection.requests] == [0, 100, 200]
+    assert all(request["$orderby"] == "ID" for request in collection.requests)
+
+
+def test_stops_when_the_server_ignores_skip(client, monkeypatch):
+    collection = FakeCollection(250, honour_skip=False)
+    monkeypatch.setattr(client, "_make_request", collection)
+
+    agents = client.list_agents()
+
+    assert len(agents) == 100
+    assert len(collection.requests) == 2
+
+
+def test_messages_are_ordered_by_creation(client, monkeypatch):
+    collection = FakeCollection(3)
+    monkeypatch.setattr(client, "_make_request", collection)
+
+    client.list_messages("A1", "C1")
+
+    assert collection.requests == [{"$top": 100, "$skip": 0, "$orderby": "createdAt,ID"}]
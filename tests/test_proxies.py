@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test how PABClient turns the environment's proxy settings into httpx mounts
+"""
+
+import pytest
+
+from pab_client import _environment_proxy_mounts
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_variables(monkeypatch):
+    for var in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+
+
+def test_proxies_and_exceptions(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "proxy.example:3128")
+    monkeypatch.setenv("ALL_PROXY", "socks5://socks.example:1080")
+    monkeypatch.setenv("NO_PROXY", ".internal.example, example.org,localhost,10.0.0.0/8,::1")
+    assert _environment_proxy_mounts() == {
+        "https://": "http://proxy.example:3128",
+        "all://": "socks5://socks.example:1080",
+        "all://*.internal.example": None,
+        "all://*example.org": None,
+        "all://localhost": None,
+        "all://10.0.0.0/8": None,
+        "all://[::1]": None,
+    }
+
+
+def test_no_proxy_star_disables_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("NO_PROXY", "example.org,*")
+    assert _environment_proxy_mounts() == {}
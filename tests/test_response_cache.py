@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the opt-in response cache against a mocked Project Agent Builder API
+"""
+
+import asyncio
+import sqlite3
+
+import httpx
+import pytest
+
+import pab_client
+from tests._fake_api import FakeAPI, fake_pab_client
+
+
+@pytest.fixture
+def response_cache(offline_credentials, tmp_path, monkeypatch):
+    """Enable the response cache on a temporary database and keep real caches untouched"""
+    monkeypatch.setenv("PAB_RESPONSE_CACHE", "1")
+    monkeypatch.setattr(pab_client, "RESPONSE_CACHE_FILE", str(tmp_path / "responses.db"))
+
+
+async def _ask(api: FakeAPI, messages, api_url: str = None, fail_first: bool = False):
+    """Create an agent on the fake API and send the messages in one chat
+    
+    With fail_first, the server rejects the first message and it is left out of the answers.
+    """
+    async with fake_pab_client(api, "Cache Test") as client:
+        if api_url:
+            client.configure(api_url=api_url)
+        agent = await client.create_agent(initial_instructions="Answer briefly.")
+        if fail_first:
+            api.fail_next_send = True
+            with pytest.raises(httpx.HTTPStatusError):
+                await agent(messages[0])
+            messages = messages[1:]
+        return [await agent(message) for message in messages]
+
+
+def test_repeated_chat_is_served_from_cache(response_cache):
+    first = FakeAPI()
+    answers = asyncio.run(_ask(first, ["a", "b"]))
+    assert [msg for _, msg in first.sent] == ["a", "b"]
+
+    second = FakeAPI()
+    assert asyncio.run(_ask(second, ["a", "b"])) == answers
+    assert second.sent == []
+
+
+def test_late_miss_replays_cached_messages_first(response_cache):
+    asyncio.run(_ask(FakeAPI(), ["a", "b"]))
+
+    api = FakeAPI()
+    asyncio.run(_ask(api, ["a", "c"]))
+    assert [msg for _, msg in api.sent] == ["a", "c"]
+    assert len({chat for chat, _ in api.sent}) == 1
+
+
+def test_failed_send_is_not_recorded(response_cache):
+    asyncio.run(_ask(FakeAPI(), ["a", "b"], fail_first=True))
+
+    # "b" was the first message the chat actually held, so a fresh chat asking "b" hits the cache
+    api = FakeAPI()
+    asyncio.run(_ask(api, ["b"]))
+    assert api.sent == []
+
+
+def test_cache_is_scoped_to_the_api_url(response_cache):
+    asyncio.run(_ask(FakeAPI(), ["a"]))
+
+    api = FakeAPI()
+    asyncio.run(_ask(api, ["a"], api_url="https://other-landscape.example"))
+    assert [msg for _, msg in api.sent] == ["a"]
+
+
+def test_batch_hits_do_not_depend_on_chat_assignment(response_cache):
+    async def batch(api: FakeAPI, concurrency: int):
+        async with fake_pab_client(api, "Cache Test") as client:
+            agent = await client.create_agent(initial_instructions="Answer briefly.")
+            return await agent.batch(["a", "b", "c", "d"], concurrency=concurrency)
+
+    answers = asyncio.run(batch(FakeAPI(), 4))
+
+    # Two chats now answer two messages each, in whatever order they take them
+    api = FakeAPI()
+    assert asyncio.run(batch(api, 2)) == answers
+    assert api.sent == []
+
+
+def test_aclose_closes_the_cache(response_cache):
+    async def main():
+        async with fake_pab_client(FakeAPI(), "Cache Test") as client:
+            cache = client._response_cache
+            assert cache is not None
+        assert client._response_cache is None
+        return cache
+
+    cache = asyncio.run(main())
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get("key")
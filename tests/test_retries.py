@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test which requests PABClient's transport retries, and how long it waits between attempts
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import pab_client
+from pab_client import _RetryTransport
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the transport's waits instead of sleeping through them"""
+    waits = []
+    sleep = asyncio.sleep
+
+    async def record(delay, *args, **kwargs):
+        waits.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(pab_client.asyncio, "sleep", record)
+    return waits
+
+
+def _send(method: str, *responses: httpx.Response):
+    """Send one request through a _RetryTransport whose server answers with responses in turn"""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return responses[len(seen) - 1]
+
+    async def main():
+        transport = _RetryTransport(httpx.MockTransport(handler), retries=2, backoff_factor=0.5)
+        async with httpx.AsyncClient(transport=transport) as http:
+            return await http.request(method, "https://api.example/api/v1/Agents")
+
+    return asyncio.run(main()), seen
+
+
+def test_get_is_retried_after_503(sleeps):
+    response, seen = _send("GET", httpx.Response(503), httpx.Response(200, json={"value": []}))
+    assert response.status_code == 200
+    assert seen == ["GET", "GET"]
+    assert len(sleeps) == 1 and 0 <= sleeps[0] <= 0.5
+
+
+def test_post_is_not_retried_after_503(sleeps):
+    response, seen = _send("POST", httpx.Response(503), httpx.Response(201, json={}))
+    assert response.status_code == 503
+    assert seen == ["POST"]
+    assert sleeps == []
+
+
+def test_retry_after_replaces_the_backoff(sleeps):
+    response, seen = _send("GET", httpx.Response(503, headers={"Retry-After": "7"}),
+                           httpx.Response(429, headers={"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"}),
+                           httpx.Response(200, json={"value": []}))
+    assert response.status_code == 200
+    assert seen == ["GET", "GET", "GET"]
+    # A date in the past means retry at once
+    assert sleeps == [7.0, 0.0]
+
+
+def test_last_attempt_returns_the_error(sleeps):
+    response, seen = _send("GET", *[httpx.Response(502)] * 3)
+    assert response.status_code == 502
+    assert len(seen) == 3
+
+
+def test_shared_http_client_requests_are_retried(offline_credentials, sleeps):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(503 if len(seen) in (1, 3) else 200, json={"value": []})
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = pab_client.PABClient(name="Shared", http_client=http)
+            get = await client._request("GET", "/api/v1/Agents")
+            post = await client._request("POST", "/api/v1/Agents", json={})
+            return get.status_code, post.status_code
+
+    # The GET succeeds on its second attempt; the POST gets the third response's 503
+    assert asyncio.run(main()) == (200, 503)
+    assert seen == ["GET", "GET", "POST"]
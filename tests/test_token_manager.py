@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test that the sync SDK's TokenManager refreshes an expired token only once
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pab_sdk.auth import TokenManager
+
+
+def test_concurrent_get_token_refreshes_once(monkeypatch):
+    manager = TokenManager("https://auth.example/oauth/token", "client", "secret")
+    refreshes = []
+
+    def refresh():
+        refreshes.append(threading.get_ident())
+        # Hold the refresh open so the other threads find the token expired
+        time.sleep(0.1)
+        manager._token = "token"
+        manager._expires_at = time.time() + 3600
+
+    monkeypatch.setattr(manager, "_refresh_token", refresh)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: manager.get_token(), range(8)))
+
+    assert tokens == ["token"] * 8
+    assert len(refreshes) == 1
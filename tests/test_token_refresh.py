@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that PABClient fetches an access token once per event loop, however many callers wait
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from pab_client import PABClient
+
+
+@pytest.fixture
+def refreshes(offline_credentials, monkeypatch):
+    """Count token refreshes; each one yields to the loop so concurrent callers overlap"""
+    calls = []
+
+    async def refresh_token(self):
+        calls.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.01)
+        self._token = "token"
+        self._token_expiry = time.time() + 3600
+
+    monkeypatch.setattr(PABClient, "_refresh_token", refresh_token)
+    return calls
+
+
+async def _get_tokens(count: int):
+    clients = [PABClient(name=f"Token Test {i}") for i in range(count)]
+    return await asyncio.gather(*(client._get_token() for client in clients))
+
+
+def test_concurrent_callers_share_one_refresh(refreshes):
+    assert asyncio.run(_get_tokens(8)) == ["token"] * 8
+    assert len(refreshes) == 1
+    assert PABClient._token_fetches == {}
+
+
+def test_each_event_loop_fetches_on_its_own(refreshes):
+    asyncio.run(_get_tokens(4))
+    # Force the second loop to fetch again rather than reuse the cached token
+    PABClient._token_cache.clear()
+    asyncio.run(_get_tokens(4))
+
+    assert len(refreshes) == 2
+    assert refreshes[0] is not refreshes[1]
+    assert PABClient._token_fetches == {}
+
+
+def test_cancelled_caller_does_not_cancel_the_refresh(refreshes):
+    async def main():
+        first, second = PABClient(name="First"), PABClient(name="Second")
+        waiting = asyncio.ensure_future(first._get_token())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        return await second._get_token()
+
+    assert asyncio.run(main()) == "token"
+    assert len(refreshes) == 1
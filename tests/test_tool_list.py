@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test that AgentInterface.list_tools doesn't cache a list that went stale while it was fetched
+"""
+
+import asyncio
+
+import httpx
+
+from pab_client import ToolType
+from tests._fake_api import FakeAPI, fake_pab_client
+
+
+class SlowToolList(FakeAPI):
+    """Holds each tool list response, read from the server, until release is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.listing = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handler(request)
+        if request.method == "GET" and request.url.path.endswith("/tools"):
+            self.listing.set()
+            await self.release.wait()
+        return response
+
+
+def test_tool_added_during_list_is_not_lost(offline_credentials):
+    api = SlowToolList()
+
+    async def main():
+        async with fake_pab_client(api) as client:
+            agent = await client.create_agent(initial_instructions="Use tools.")
+            listing = asyncio.ensure_future(agent.list_tools())
+            await api.listing.wait()
+            await client.add_tool("calculator", ToolType.CALCULATOR)
+            api.release.set()
+
+            assert await listing == []
+            assert [tool["name"] for tool in await agent.list_tools()] == ["calculator"]
+
+    asyncio.run(main())